@@ -88,7 +88,7 @@ class AIRuleEngine:
             )
             
         except Exception as e:
-            logger.error(f"AI rule suggestion failed for column {column_info.name}: {str(e)}")
+            logger.error("AI rule suggestion failed", column=column_info.name, error=str(e))
             return self._fallback_rule_suggestion(column_info)
     
     def _create_analysis_prompt(self, column_info: ColumnInfo, sample_data: List[Any]) -> str:
@@ -28,14 +28,14 @@ class S3RuleManager:
             logger.error("AWS credentials not found. Please configure AWS credentials.")
             raise
         except Exception as e:
-            logger.error(f"Failed to initialize S3 client: {str(e)}")
+            logger.error("Failed to initialize S3 client", error=str(e))
             raise
     
     def _ensure_bucket_exists(self):
         """Create S3 bucket if it doesn't exist"""
         try:
             self.s3_client.head_bucket(Bucket=self.bucket_name)
-            logger.info(f"S3 bucket {self.bucket_name} exists")
+            logger.info("S3 bucket exists", bucket=self.bucket_name)
         except ClientError as e:
             error_code = int(e.response['Error']['Code'])
             if error_code == 404:
@@ -48,12 +48,12 @@ class S3RuleManager:
                             Bucket=self.bucket_name,
                             CreateBucketConfiguration={'LocationConstraint': settings.AWS_REGION}
                         )
-                    logger.info(f"Created S3 bucket: {self.bucket_name}")
+                    logger.info("Created S3 bucket", bucket=self.bucket_name)
                 except ClientError as create_error:
-                    logger.error(f"Failed to create bucket: {str(create_error)}")
+                    logger.error("Failed to create bucket", error=str(create_error))
                     raise
             else:
-                logger.error(f"Error accessing bucket: {str(e)}")
+                logger.error("Error accessing bucket", error=str(e))
                 raise
     
     def upload_rule_set(self, rule_set: RuleSet, file_name: Optional[str] = None) -> str:
@@ -63,16 +63,13 @@ class S3RuleManager:
                 file_name = f"rules/{uuid.uuid4()}.json"
             
             # Convert rule set to JSON
-            rule_data = rule_set.dict()
-            rule_data['created_at'] = rule_data['created_at'].isoformat()
-            for rule in rule_data['rules']:
-                rule['created_at'] = rule['created_at'].isoformat()
+            rule_data = rule_set.model_dump_json(indent=2)
             
             # Upload to S3
             self.s3_client.put_object(
                 Bucket=self.bucket_name,
                 Key=file_name,
-                Body=json.dumps(rule_data, indent=2),
+                Body=rule_data,
                 ContentType='application/json',
                 Metadata={
                     'rule-set-name': rule_set.name,
@@ -81,29 +78,22 @@ class S3RuleManager:
                 }
             )
             
-            logger.info(f"Uploaded rule set to S3: {file_name}")
+            logger.info("Uploaded rule set to S3", key=file_name)
             return file_name
             
         except Exception as e:
-            logger.error(f"Failed to upload rule set to S3: {str(e)}")
+            logger.error("Failed to upload rule set to S3", error=str(e))
             raise
     
     def download_rule_set(self, s3_key: str) -> RuleSet:
         """Download rule set from S3"""
         try:
             response = self.s3_client.get_object(Bucket=self.bucket_name, Key=s3_key)
-            rule_data = json.loads(response['Body'].read().decode('utf-8'))
-            
-            # Convert datetime strings back to datetime objects
-            from datetime import datetime
-            rule_data['created_at'] = datetime.fromisoformat(rule_data['created_at'])
-            for rule in rule_data['rules']:
-                rule['created_at'] = datetime.fromisoformat(rule['created_at'])
-            
-            return RuleSet(**rule_data)
+            # Pydantic parses the ISO datetime strings directly
+            return RuleSet.model_validate_json(response['Body'].read())
             
         except Exception as e:
-            logger.error(f"Failed to download rule set from S3: {str(e)}")
+            logger.error("Failed to download rule set from S3", error=str(e))
             raise
     
     def list_rule_sets(self) -> List[Dict[str, Any]]:
@@ -136,17 +126,17 @@ class S3RuleManager:
             return rule_sets
             
         except Exception as e:
-            logger.error(f"Failed to list rule sets from S3: {str(e)}")
+            logger.error("Failed to list rule sets from S3", error=str(e))
             raise
     
     def delete_rule_set(self, s3_key: str) -> bool:
         """Delete rule set from S3"""
         try:
             self.s3_client.delete_object(Bucket=self.bucket_name, Key=s3_key)
-            logger.info(f"Deleted rule set from S3: {s3_key}")
+            logger.info("Deleted rule set from S3", key=s3_key)
             return True
         except Exception as e:
-            logger.error(f"Failed to delete rule set from S3: {str(e)}")
+            logger.error("Failed to delete rule set from S3", error=str(e))
             return False
 
 class LambdaExecutor:
@@ -174,7 +164,7 @@ class LambdaExecutor:
             return result
             
         except Exception as e:
-            logger.error(f"Failed to invoke Lambda function: {str(e)}")
+            logger.error("Failed to invoke Lambda function", error=str(e))
             raise
     
     def deploy_validation_function(self, zip_file_path: str) -> bool:
@@ -192,7 +182,7 @@ class LambdaExecutor:
                     MemorySize=512
                 )
             
-            logger.info(f"Deployed Lambda function: {self.function_name}")
+            logger.info("Deployed Lambda function", function=self.function_name)
             return True
             
         except ClientError as e:
@@ -203,8 +193,8 @@ class LambdaExecutor:
                         FunctionName=self.function_name,
                         ZipFile=zip_file.read()
                     )
-                logger.info(f"Updated Lambda function: {self.function_name}")
+                logger.info("Updated Lambda function", function=self.function_name)
                 return True
             else:
-                logger.error(f"Failed to deploy Lambda function: {str(e)}")
+                logger.error("Failed to deploy Lambda function", error=str(e))
                 return False
\ No newline at end of file
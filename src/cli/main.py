@@ -6,24 +6,66 @@ from rich.prompt import Prompt, Confirm
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.syntax import Syntax
 from pathlib import Path
-import json
+import asyncio
+import inspect
+import orjson
 import os
+import re
 import subprocess
-from typing import Dict, Any, List, Optional
+import sys
+import zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import ExitStack, nullcontext
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
+import numpy as np
+import pandas as pd
 
 from ..config.settings import settings
 from ..models.validation import (
     DataSourceType, DataSourceConfig, ValidationRule, RuleSet, 
-    RuleType, ColumnInfo, ValidationResult
+    RuleType, ColumnInfo, ValidationResult, SQLGenerationContext
 )
 from ..database.connectors import DatabaseManager
 from ..ai.rule_engine import AIRuleEngine
 from ..aws.services import S3RuleManager
-from ..core.validation_engine import ValidationEngine
+from ..core.validation_engine import ValidationEngine, SQLValidationEngine
 
 console = Console()
 
+# Characters not allowed in rule set file names
+SAFE_NAME_RE = re.compile(r'[^a-zA-Z0-9_-]')
+
+# Maximum number of rules executed concurrently when they are run one query per rule
+RULE_EXECUTION_WORKERS = 8
+
+# Rich (color, icon) per validation status; anything else (ERROR/INFO) renders as a warning
+STATUS_STYLES = {"PASS": ("green", "✅"), "FAIL": ("red", "❌")}
+DEFAULT_STATUS_STYLE = ("yellow", "⚠️")
+
+# SQL scripts longer than this are rendered on the terminal background to skip the theme fill
+LARGE_SQL_CHARS = 10_000
+
+class _NoopProgress:
+    """Stand-in for rich Progress when output is not a terminal"""
+    
+    def add_task(self, description: str, total: Optional[float] = None) -> int:
+        return 0
+    
+    def advance(self, task_id: int, advance: float = 1) -> None:
+        pass
+
+@lru_cache(maxsize=1)
+def get_ai_engine() -> AIRuleEngine:
+    """Return the session-wide AI rule engine, created on first use"""
+    return AIRuleEngine()
+
+@lru_cache(maxsize=1)
+def get_s3_manager() -> S3RuleManager:
+    """Return the session-wide S3 rule manager, created on first use"""
+    return S3RuleManager()
+
 @click.group()
 @click.version_option(version="1.0.0")
 def cli():
@@ -39,9 +81,29 @@ def cli():
     ))
 
 @cli.command()
-def start():
+@click.option('--split-sql-files', is_flag=True, default=False,
+              help='Save one SQL file per rule instead of a single combined file')
+@click.option('--include-sql-in-json', is_flag=True, default=False,
+              help='Also embed the generated SQL in the JSON results file')
+@click.option('--parallel-io', is_flag=True, default=False,
+              help='Write per-rule SQL files concurrently from a thread pool (requires --split-sql-files)')
+@click.option('--zip-sql-files', is_flag=True, default=False,
+              help='Store one SQL script per rule inside a single compressed ZIP archive '
+                   '(cannot be combined with --split-sql-files)')
+@click.option('--quiet', is_flag=True, default=False,
+              help='Print a compact one-line-per-rule results summary')
+@click.option('--table', 'table_hint', default=None,
+              help='Validate this table directly instead of listing every table first')
+def start(split_sql_files: bool, include_sql_in_json: bool, parallel_io: bool, zip_sql_files: bool,
+          quiet: bool, table_hint: Optional[str]):
     """Start the interactive data validation workflow"""
     
+    # Reject output flags that would otherwise be silently ignored before any prompting starts
+    if zip_sql_files and split_sql_files:
+        raise click.UsageError("--zip-sql-files and --split-sql-files cannot be used together")
+    if parallel_io and not split_sql_files:
+        raise click.UsageError("--parallel-io requires --split-sql-files")
+    
     console.print("\n🎯 [bold green]Welcome to VP Data Accuracy Engine![/bold green]")
     console.print("Let's start by connecting to your data source...\n")
     
@@ -61,8 +123,9 @@ def start():
         
         # Inner loop for table selection and validation workflow
         while True:
-            # Step 3: Show tables and columns
-            table_result = select_table_and_show_columns(connector, data_source_config)
+            # Step 3: Show tables and columns (the --table hint only applies to the first selection)
+            table_result = select_table_and_show_columns(connector, data_source_config, hint=table_hint)
+            table_hint = None
             if table_result == "back":
                 break  # Go back to data source selection
             elif not table_result:
@@ -92,7 +155,14 @@ def start():
                 continue  # Go back to action selection
             
             # Step 6: Execute validation
-            execute_validation_workflow(connector, rule_set, table_name)
+            execute_validation_workflow(
+                connector, rule_set, table_name,
+                split_sql_files=split_sql_files,
+                include_sql_in_json=include_sql_in_json,
+                parallel_io=parallel_io,
+                zip_sql_files=zip_sql_files,
+                quiet=quiet
+            )
             
             # Step 7: Ask what to do next
             next_action = ask_next_action()
@@ -101,9 +171,13 @@ def start():
             elif next_action == "new_source":
                 break  # Break inner loop to go back to data source selection
             elif next_action == "exit":
+                connector.disconnect()
                 console.print("\n👋 [bold blue]Thank you for using VP Data Accuracy Engine![/bold blue]")
                 return
         
+        # Leaving this data source: release the connection and its cached metadata
+        connector.disconnect()
+        
         # If we broke out of inner loop due to "new_source", continue outer loop
         # If we broke out due to "restart", continue inner loop (but outer loop will restart inner loop)
         if next_action == "new_source":
@@ -204,17 +278,22 @@ def configure_csv() -> DataSourceConfig:
     
     while True:
         file_path = Prompt.ask("Enter CSV file path")
+        csv_path = Path(file_path)
         
-        if Path(file_path).exists():
+        # Reject empty files here, before the connector allocates a DataFrame for them
+        if csv_path.is_file() and csv_path.stat().st_size > 0:
             return DataSourceConfig(
                 type=DataSourceType.CSV,
-                name=f"csv_{Path(file_path).stem}",
-                file_path=file_path
+                name=f"csv_{csv_path.stem}",
+                file_path=str(csv_path.resolve())
             )
+        elif csv_path.is_file():
+            console.print(f"❌ [red]File is empty: {file_path}[/red]")
         else:
             console.print(f"❌ [red]File not found: {file_path}[/red]")
-            if not Confirm.ask("Try again?"):
-                return None
+        
+        if not Confirm.ask("Try again?"):
+            return None
 
 def connect_to_data_source(config: DataSourceConfig):
     """Step 2: Connect to data source and test connection"""
@@ -237,12 +316,27 @@ def connect_to_data_source(config: DataSourceConfig):
         console.print(f"❌ [red]Connection error: {str(e)}[/red]")
         return None
 
-def select_table_and_show_columns(connector, config: DataSourceConfig):
+def select_table_and_show_columns(connector, config: DataSourceConfig, hint: Optional[str] = None):
     """Step 3: Show tables and let user select, then show columns"""
     
     console.print("\n📋 [bold cyan]Step 3: Database Schema Overview[/bold cyan]")
     
     try:
+        # A known table name skips listing (and profiling) every other table in the schema;
+        # the rest is loaded on demand if cross-table rules are detected later
+        if hint:
+            try:
+                columns = connector.get_columns(hint)
+            except Exception:
+                columns = None
+            if columns:
+                console.print(f"\n📊 [bold cyan]Detailed Analysis for {hint}:[/bold cyan]")
+                display_column_info(columns)
+                # table_info is a serialized model field, so it holds ColumnInfo objects rather than the frame
+                config.table_info = {hint: list(columns)}
+                return hint
+            console.print(f"⚠️ [yellow]Table '{hint}' not found or has no columns, listing all tables...[/yellow]")
+        
         tables = connector.get_tables()
         
         if not tables:
@@ -256,7 +350,7 @@ def select_table_and_show_columns(connector, config: DataSourceConfig):
         for table in tables:
             try:
                 columns = connector.get_columns(table)
-                all_tables_info[table] = columns
+                all_tables_info[table] = list(columns)
                 console.print(f"\n🗂️  [bold]{table}[/bold] ({len(columns)} columns)")
                 column_names = [col.name for col in columns[:5]]  # Show first 5 columns
                 if len(columns) > 5:
@@ -319,19 +413,20 @@ def display_column_info(columns: List[ColumnInfo]):
     table.add_column("Null Count", style="red", justify="right")
     table.add_column("Sample Values", style="dim", width=30)
     
-    for col in columns:
-        sample_str = ", ".join(str(v) for v in col.sample_values[:3])
-        if len(col.sample_values) > 3:
-            sample_str += "..."
-        
-        table.add_row(
+    # Pre-format every row up front, then hand them to Rich in one pass
+    rows = [
+        (
             col.name,
             col.data_type,
             "Yes" if col.nullable else "No",
             str(col.unique_count) if col.unique_count is not None else "N/A",
             str(col.null_count) if col.null_count is not None else "N/A",
-            sample_str[:30]
+            (", ".join([str(v) for v in col.sample_values[:3]]) + ("..." if len(col.sample_values) > 3 else ""))[:30]
         )
+        for col in columns
+    ]
+    for row in rows:
+        table.add_row(*row)
     
     console.print(table)
 
@@ -359,19 +454,16 @@ def handle_ai_suggestion(connector, config: DataSourceConfig, table_name: str) -
     console.print("Analyzing your data to suggest validation rules...")
     
     try:
-        # Get column information and sample data for primary table
+        # Get column information and sample values for primary table,
+        # reusing the columns already fetched during table selection
         with console.status("Analyzing data patterns..."):
-            columns = connector.get_columns(table_name)
-            sample_df = connector.get_sample_data(table_name, limit=100)
+            columns = (config.table_info or {}).get(table_name)
+            if columns is None:
+                columns = connector.get_columns(table_name)
+            sample_data = connector.get_sample_values(table_name, [col.name for col in columns], 10)
         
         # Initialize AI engine
-        ai_engine = AIRuleEngine()
-        
-        # Get sample data for each column
-        sample_data = {}
-        for col in columns:
-            if col.name in sample_df.columns:
-                sample_data[col.name] = sample_df[col.name].dropna().tolist()[:10]
+        ai_engine = get_ai_engine()
         
         # Get AI suggestions for single-table rules
         with console.status("Getting AI recommendations..."):
@@ -398,10 +490,12 @@ def handle_ai_suggestion(connector, config: DataSourceConfig, table_name: str) -
                         all_rules.append(rule)
         
         # Auto-generate cross-table rules if multiple tables available
-        if hasattr(config, 'table_info') and config.table_info and len(config.table_info) > 1:
+        with console.status("Loading related tables..."):
+            table_info = load_all_tables_info(connector, config)
+        if len(table_info) > 1:
             console.print(f"\n🔗 [bold yellow]Detecting Cross-Table Relationship Rules...[/bold yellow]")
             
-            cross_table_rules = generate_cross_table_rules(config.table_info, table_name)
+            cross_table_rules = generate_cross_table_rules(table_info, table_name)
             if cross_table_rules:
                 console.print(f"🎯 [bold green]Found {len(cross_table_rules)} potential cross-table rules:[/bold green]")
                 for rule in cross_table_rules:
@@ -423,13 +517,8 @@ def handle_ai_suggestion(connector, config: DataSourceConfig, table_name: str) -
                 rules=all_rules
             )
             
-            with open(suggested_file, 'w') as f:
-                rule_data = rule_set.model_dump()
-                # Convert datetime to string for JSON serialization
-                rule_data['created_at'] = rule_data['created_at'].isoformat()
-                for rule in rule_data['rules']:
-                    rule['created_at'] = rule['created_at'].isoformat()
-                json.dump(rule_data, f, indent=2)
+            with open(suggested_file, 'w', encoding='utf-8') as f:
+                f.write(rule_set.model_dump_json(indent=2))
             
             console.print(f"\n💾 [green]AI suggestions saved to: {suggested_file}[/green]")
             
@@ -446,6 +535,20 @@ def handle_ai_suggestion(connector, config: DataSourceConfig, table_name: str) -
         console.print(f"❌ [red]AI suggestion failed: {str(e)}[/red]")
         return None
 
+def load_all_tables_info(connector, config: DataSourceConfig) -> Dict[str, List[ColumnInfo]]:
+    """Complete config.table_info with every table's columns, profiling only tables not loaded yet"""
+    table_info = dict(config.table_info or {})
+    for table in connector.get_tables():
+        if table in table_info:
+            continue
+        try:
+            table_info[table] = list(connector.get_columns(table))
+        except Exception:
+            console.print(f"⚠️ [yellow]Unable to read columns for {table}[/yellow]")
+    
+    config.table_info = table_info
+    return table_info
+
 def generate_cross_table_rules(table_info: Dict[str, List[ColumnInfo]], primary_table: str) -> List[ValidationRule]:
     """Generate cross-table validation rules based on table relationships"""
     
@@ -542,7 +645,13 @@ def handle_existing_rules(config: DataSourceConfig, table_name: str) -> Optional
     if not templates_dir.exists():
         templates_dir.mkdir()
     
-    rule_files = list(templates_dir.glob("*.json"))
+    # DirEntry caches name/path/type from the directory listing, so no per-file stat or Path objects
+    with os.scandir(templates_dir) as entries:
+        rule_files = sorted(
+            (entry for entry in entries
+             if entry.name.endswith('.json') and entry.is_file(follow_symlinks=False)),
+            key=lambda entry: entry.name
+        )
     
     if not rule_files:
         console.print("❌ [red]No existing rule files found in templates/ directory[/red]")
@@ -551,18 +660,19 @@ def handle_existing_rules(config: DataSourceConfig, table_name: str) -> Optional
     
     # Display available rule files
     console.print("Available rule files:")
-    for i, file_path in enumerate(rule_files, 1):
+    for i, entry in enumerate(rule_files, 1):
         try:
-            with open(file_path, 'r') as f:
-                rule_data = json.load(f)
+            # Only name and rule count are needed here; orjson parses without building models
+            with open(entry.path, 'rb') as f:
+                rule_data = orjson.loads(f.read())
             
-            name = rule_data.get('name', file_path.stem)
+            name = rule_data.get('name', entry.name[:-len('.json')])
             rule_count = len(rule_data.get('rules', []))
             description = rule_data.get('description', 'No description')
             
-            console.print(f"  {i}. {file_path.name} - {name} ({rule_count} rules)")
+            console.print(f"  {i}. {entry.name} - {name} ({rule_count} rules)")
         except Exception:
-            console.print(f"  {i}. {file_path.name} - [red](Invalid file)[/red]")
+            console.print(f"  {i}. {entry.name} - [red](Invalid file)[/red]")
     
     console.print(f"  0. ⬅️  Back to action selection")
     
@@ -585,22 +695,14 @@ def handle_existing_rules(config: DataSourceConfig, table_name: str) -> Optional
     
     # Load selected rule file
     try:
-        with open(selected_file, 'r') as f:
-            rule_data = json.load(f)
-        
-        # Convert datetime strings back to datetime objects
-        from datetime import datetime
-        if 'created_at' in rule_data:
-            rule_data['created_at'] = datetime.fromisoformat(rule_data['created_at'])
-        
-        for rule in rule_data.get('rules', []):
-            if 'created_at' in rule:
-                rule['created_at'] = datetime.fromisoformat(rule['created_at'])
+        with open(selected_file.path, 'rb') as f:
+            rule_data = orjson.loads(f.read())
         
         # Update data source config
-        rule_data['data_source'] = config.dict()
+        rule_data['data_source'] = config
         
-        rule_set = RuleSet(**rule_data)
+        # Pydantic parses the ISO datetime strings directly
+        rule_set = RuleSet.model_validate(rule_data)
         
         console.print(f"✅ [green]Loaded {len(rule_set.rules)} rules from {selected_file.name}[/green]")
         return rule_set
@@ -616,8 +718,7 @@ def handle_create_new_rules(config: DataSourceConfig, table_name: str) -> Option
     
     rule_set_name = Prompt.ask("Enter a name for your rule set", default=f"Rules for {table_name}")
     
-    import re
-    safe_name = re.sub(r'[^a-zA-Z0-9_-]', '_', rule_set_name.lower())
+    safe_name = SAFE_NAME_RE.sub('_', rule_set_name.lower())
     template_file = f"templates/{safe_name}.json"
     
     template_rule_set = RuleSet(
@@ -638,12 +739,8 @@ def handle_create_new_rules(config: DataSourceConfig, table_name: str) -> Option
     
     Path("templates").mkdir(exist_ok=True)
     
-    with open(template_file, 'w') as f:
-        rule_data = template_rule_set.dict()
-        rule_data['created_at'] = rule_data['created_at'].isoformat()
-        for rule in rule_data['rules']:
-            rule['created_at'] = rule['created_at'].isoformat()
-        json.dump(rule_data, f, indent=2)
+    with open(template_file, 'w', encoding='utf-8') as f:
+        f.write(template_rule_set.model_dump_json(indent=2))
     
     console.print(f"📁 [green]Created template file: {template_file}[/green]")
     console.print("\n📝 [yellow]Please edit this file to define your validation rules.[/yellow]")
@@ -661,28 +758,30 @@ def handle_create_new_rules(config: DataSourceConfig, table_name: str) -> Option
             if os.name == 'nt':
                 os.startfile(template_file)
             elif os.name == 'posix':
-                subprocess.call(['open', template_file])
+                # Detach the opener so a blocking editor does not hold up the prompt below
+                opener = 'open' if sys.platform == 'darwin' else 'xdg-open'
+                subprocess.Popen(
+                    [opener, template_file],
+                    start_new_session=True,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL
+                )
         except Exception as e:
             console.print(f"❌ [red]Could not open file automatically: {str(e)}[/red]")
     
     input("\n⏸️  Press Enter when you have finished editing the file...")
     
+    # Parse the edited file once; the same RuleSet is uploaded and returned
+    try:
+        with open(template_file, 'rb') as f:
+            rule_set = RuleSet.model_validate_json(f.read())
+    except Exception as e:
+        console.print(f"❌ [red]Failed to load edited rules: {str(e)}[/red]")
+        return None
+    
     if Confirm.ask("Upload rules to AWS S3 for backup?"):
         try:
-            s3_manager = S3RuleManager()
-            
-            with open(template_file, 'r') as f:
-                rule_data = json.load(f)
-            
-            from datetime import datetime
-            if 'created_at' in rule_data:
-                rule_data['created_at'] = datetime.fromisoformat(rule_data['created_at'])
-            
-            for rule in rule_data.get('rules', []):
-                if 'created_at' in rule:
-                    rule['created_at'] = datetime.fromisoformat(rule['created_at'])
-            
-            rule_set = RuleSet(**rule_data)
+            s3_manager = get_s3_manager()
             
             with console.status("Uploading to S3..."):
                 s3_key = s3_manager.upload_rule_set(rule_set, f"rules/{safe_name}.json")
@@ -692,30 +791,15 @@ def handle_create_new_rules(config: DataSourceConfig, table_name: str) -> Option
         except Exception as e:
             console.print(f"❌ [red]S3 upload failed: {str(e)}[/red]")
     
-    try:
-        with open(template_file, 'r') as f:
-            rule_data = json.load(f)
-        
-        from datetime import datetime
-        if 'created_at' in rule_data:
-            rule_data['created_at'] = datetime.fromisoformat(rule_data['created_at'])
-        
-        for rule in rule_data.get('rules', []):
-            if 'created_at' in rule:
-                rule['created_at'] = datetime.fromisoformat(rule['created_at'])
-        
-        rule_set = RuleSet(**rule_data)
-        
-        enabled_rules = [r for r in rule_set.rules if r.enabled]
-        console.print(f"✅ [green]Loaded {len(enabled_rules)} enabled rules from your file[/green]")
-        
-        return rule_set
-        
-    except Exception as e:
-        console.print(f"❌ [red]Failed to load edited rules: {str(e)}[/red]")
-        return None
+    enabled_rules = [r for r in rule_set.rules if r.enabled]
+    console.print(f"✅ [green]Loaded {len(enabled_rules)} enabled rules from your file[/green]")
+    
+    return rule_set
 
-def execute_validation_workflow(connector, rule_set: RuleSet, table_name: str):
+def execute_validation_workflow(connector, rule_set: RuleSet, table_name: str,
+                                split_sql_files: bool = False, include_sql_in_json: bool = False,
+                                parallel_io: bool = False, zip_sql_files: bool = False,
+                                quiet: bool = False):
     """Step 6: Execute validation rules and show results"""
     
     console.print(f"\n🚀 [bold green]Step 5: Executing Validation[/bold green]")
@@ -730,111 +814,293 @@ def execute_validation_workflow(connector, rule_set: RuleSet, table_name: str):
     console.print(f"📊 Executing {len(enabled_rules)} validation rules...")
     
     try:
-        # Import the new SQL validation engine
-        from src.core.validation_engine import SQLValidationEngine
-        from src.models.validation import SQLGenerationContext
-        
         # Create SQL generation context
         context = SQLGenerationContext(
             database_type=rule_set.data_source.type,
             schema_name=None,  # Can be extended to support schema
             table_name=table_name,
-            connection_info=rule_set.data_source.connection_params
+            connection_info=rule_set.data_source.connection_params,
+            query_engine=connector.query_engine
         )
         
         # Initialize SQL validation engine
-        sql_engine = SQLValidationEngine(context)
+        # Generated SQL is cached on disk so re-running the same rule set skips generation
+        sql_engine = SQLValidationEngine(
+            context,
+            cache_dir=Path(settings.SQL_CACHE_DIR).expanduser() if settings.SQL_CACHE_DIR else None,
+            cache_ttl=settings.SQL_CACHE_TTL,
+            cache_max_entries=settings.SQL_CACHE_MAX_ENTRIES
+        )
+        
+        # Convert rules to dict format up front so the loop body only does SQL work
+        rule_dicts = [
+            {
+                'name': r.name,
+                'rule_type': r.rule_type.value,
+                'target_column': r.target_column,
+                'parameters': r.parameters
+            }
+            for r in enabled_rules
+        ]
         
         # Generate and execute SQL for each rule
-        validation_results = []
-        
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console
-        ) as progress:
-            task = progress.add_task("Generating and executing SQL validation scripts...", total=len(enabled_rules))
+        validation_results = None
+        if supports_async_execution(connector):
+            # Async drivers multiplex all rules over the event loop instead of running them one by one
+            with console.status("Generating and executing SQL validation scripts..."):
+                validation_results = asyncio.run(
+                    execute_rules_async(connector, sql_engine, enabled_rules, rule_dicts)
+                )
+        elif rule_set.data_source.type in (DataSourceType.POSTGRESQL, DataSourceType.MYSQL):
+            # Send every rule in a single round-trip; fall back to per-rule execution if the database rejects it
+            try:
+                with console.status("Generating and executing batched SQL validation script..."):
+                    validation_results = execute_rules_batched(connector, sql_engine, enabled_rules, rule_dicts)
+            except Exception as batch_error:
+                console.print(f"⚠️ [yellow]Batched execution failed, running rules one by one: {str(batch_error)}[/yellow]")
+        
+        if validation_results is None:
+            validation_results: List[Optional[ValidationResult]] = [None] * len(enabled_rules)
             
-            for rule in enabled_rules:
-                try:
-                    # Convert rule to dict format
-                    rule_dict = {
-                        'name': rule.name,
-                        'rule_type': rule.rule_type.value,
-                        'target_column': rule.target_column,
-                        'parameters': rule.parameters
-                    }
-                    
-                    # Generate SQL script
-                    sql_script = sql_engine.generate_validation_sql(rule_dict)
-                    
-                    # Execute SQL and get results
-                    if hasattr(connector, 'execute_query'):
-                        # For database connectors
-                        result_df = connector.execute_query(sql_script)
-                        if not result_df.empty:
-                            result_row = result_df.iloc[0]
-                            validation_result = ValidationResult(
-                                rule_name=rule.name,
-                                rule_id=rule.id,
-                                status="PASS" if result_row.get('status') == 'PASS' else "FAIL",
-                                total_rows=int(result_row.get('total_rows', 0)),
-                                failed_rows=int(result_row.get('failed_rows', 0)),
-                                passed_rows=int(result_row.get('passed_rows', 0)),
-                                generated_sql=sql_script,
-                                details={'sql_result': result_row.to_dict()}
-                            )
-                        else:
-                            validation_result = ValidationResult(
-                                rule_name=rule.name,
-                                rule_id=rule.id,
-                                status="ERROR",
-                                error_message="No results returned from SQL execution",
-                                generated_sql=sql_script
-                            )
-                    else:
-                        # For CSV connectors - show generated SQL only
-                        validation_result = ValidationResult(
-                            rule_name=rule.name,
-                            rule_id=rule.id,
-                            status="INFO",
-                            error_message="SQL generated but not executed (CSV data source)",
-                            generated_sql=sql_script,
-                            details={'note': 'Use database connector to execute SQL'}
-                        )
-                    
-                    validation_results.append(validation_result)
-                    
-                except Exception as rule_error:
-                    console.print(f"❌ [red]Error processing rule '{rule.name}': {str(rule_error)}[/red]")
-                    validation_results.append(ValidationResult(
-                        rule_name=rule.name,
-                        rule_id=rule.id,
-                        status="ERROR",
-                        error_message=str(rule_error)
-                    ))
+            # Skip the live renderer when nobody is watching (CI, redirected output)
+            progress_cm = Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                console=console
+            ) if console.is_terminal else nullcontext(_NoopProgress())
+            
+            with progress_cm as progress:
+                task = progress.add_task("Generating and executing SQL validation scripts...", total=len(enabled_rules))
                 
-                progress.advance(task)
+                # Rules are independent read-only queries; run them concurrently over the connector's pool
+                with ThreadPoolExecutor(max_workers=RULE_EXECUTION_WORKERS) as executor:
+                    futures = {
+                        executor.submit(execute_rule, connector, sql_engine, rule, rule_dict): i
+                        for i, (rule, rule_dict) in enumerate(zip(enabled_rules, rule_dicts))
+                    }
+                    for future in as_completed(futures):
+                        validation_results[futures[future]] = future.result()
+                        progress.advance(task)
         
         # Display results
-        display_sql_validation_results(validation_results)
+        display_sql_validation_results(validation_results, quiet=quiet)
         
         # Ask to save SQL scripts
         if Confirm.ask("Save generated SQL scripts to file?"):
-            save_sql_scripts(validation_results, table_name)
+            save_sql_scripts(
+                validation_results, table_name,
+                split_files=split_sql_files,
+                include_sql_in_json=include_sql_in_json,
+                parallel_io=parallel_io,
+                zip_sql_files=zip_sql_files
+            )
         
     except Exception as e:
         console.print(f"❌ [red]Validation execution failed: {str(e)}[/red]")
         import traceback
         console.print(f"[red]Details: {traceback.format_exc()}[/red]")
 
-def display_sql_validation_results(results: List[ValidationResult]):
+def build_validation_result(rule: ValidationRule, sql_script: str,
+                            result_row: Optional[Dict[str, Any]]) -> ValidationResult:
+    """Convert the first row of a validation query into a ValidationResult"""
+    if result_row is None:
+        return ValidationResult(
+            rule_name=rule.name,
+            rule_id=rule.id,
+            status="ERROR",
+            error_message="No results returned from SQL execution",
+            generated_sql=sql_script
+        )
+    
+    return ValidationResult(
+        rule_name=rule.name,
+        rule_id=rule.id,
+        status="PASS" if result_row.get('status') == 'PASS' else "FAIL",
+        total_rows=int(result_row.get('total_rows', 0)),
+        failed_rows=int(result_row.get('failed_rows', 0)),
+        passed_rows=int(result_row.get('passed_rows', 0)),
+        generated_sql=sql_script,
+        details={'sql_result': result_row}
+    )
+
+def execute_rule(connector, sql_engine, rule: ValidationRule, rule_dict: Dict[str, Any]) -> ValidationResult:
+    """Generate and execute a single rule, converting failures into an ERROR result"""
+    try:
+        # Generate SQL script
+        sql_script = sql_engine.generate_validation_sql(rule_dict)
+        
+        # CSV sources without DuckDB have no SQL engine - show generated SQL only
+        if not connector.supports_sql_execution():
+            return ValidationResult(
+                rule_name=rule.name,
+                rule_id=rule.id,
+                status="INFO",
+                error_message="SQL generated but not executed (CSV data source)",
+                generated_sql=sql_script,
+                details={'note': 'Install duckdb or use a database connector to execute SQL'}
+            )
+        
+        # Validation queries return a single summary row; skip building a DataFrame for it
+        return build_validation_result(rule, sql_script, connector.execute_scalar_row(sql_script))
+        
+    except Exception as rule_error:
+        console.print(f"❌ [red]Error processing rule '{rule.name}': {str(rule_error)}[/red]")
+        return ValidationResult(
+            rule_name=rule.name,
+            rule_id=rule.id,
+            status="ERROR",
+            error_message=str(rule_error)
+        )
+
+def execute_rules_batched(connector, sql_engine, rules: List[ValidationRule],
+                          rule_dicts: List[Dict[str, Any]]) -> List[ValidationResult]:
+    """Generate all rules and execute them as one UNION ALL query.
+    
+    Rules sharing a column are answered by one fused scan inside the same statement.
+    """
+    validation_results: List[Optional[ValidationResult]] = [None] * len(rules)
+    
+    fused = sql_engine.fuse_rules_by_column(rule_dicts)
+    fused_sql_by_rule = {
+        str(i): fused_sql for indices, fused_sql in fused.values() for i in indices
+    }
+    
+    # Rules are keyed by their position so names/ids need not be unique; fused rules keep their
+    # standalone SQL for display and saving but are answered by their column's scan
+    sql_scripts = {}
+    for i, (rule, rule_dict) in enumerate(zip(rules, rule_dicts)):
+        try:
+            sql_scripts[str(i)] = sql_engine.generate_validation_sql(rule_dict)
+        except Exception as rule_error:
+            console.print(f"❌ [red]Error processing rule '{rule.name}': {str(rule_error)}[/red]")
+            validation_results[i] = ValidationResult(
+                rule_name=rule.name,
+                rule_id=rule.id,
+                status="ERROR",
+                error_message=str(rule_error)
+            )
+    
+    if sql_scripts:
+        rule_sqls = {
+            rule_id: sql for rule_id, sql in sql_scripts.items() if rule_id not in fused_sql_by_rule
+        }
+        result_df = connector.execute_query(sql_engine.generate_batched_validation_sql(rule_sqls, fused))
+        if not result_df.empty:
+            result_df = result_df.astype({'rule_id': str}).drop_duplicates('rule_id').set_index('rule_id')
+        
+        returned_ids = [rule_id for rule_id in sql_scripts if rule_id in result_df.index]
+        for rule_id in sql_scripts.keys() - set(returned_ids):
+            i = int(rule_id)
+            validation_results[i] = build_validation_result(rules[i], sql_scripts[rule_id], None)
+        
+        if returned_ids:
+            parsed = build_validation_results(
+                [rules[int(rule_id)] for rule_id in returned_ids],
+                [sql_scripts[rule_id] for rule_id in returned_ids],
+                result_df.loc[returned_ids].reset_index(drop=True)
+            )
+            for rule_id, result in zip(returned_ids, parsed):
+                if rule_id in fused_sql_by_rule:
+                    result.details['fused_sql'] = fused_sql_by_rule[rule_id]
+                validation_results[int(rule_id)] = result
+    
+    return validation_results
+
+def supports_async_execution(connector) -> bool:
+    """Check whether the connector exposes a coroutine-based query API"""
+    if hasattr(connector, 'execute_query_async'):
+        return True
+    return inspect.iscoroutinefunction(getattr(connector, 'execute_query', None))
+
+async def execute_rules_async(connector, sql_engine, rules: List[ValidationRule],
+                              rule_dicts: List[Dict[str, Any]]) -> List[ValidationResult]:
+    """Generate and execute all rules concurrently on an async connector"""
+    execute = getattr(connector, 'execute_query_async', None) or connector.execute_query
+    
+    async def _run(rule_dict: Dict[str, Any]):
+        sql_script = sql_engine.generate_validation_sql(rule_dict)
+        result_df = await execute(sql_script)
+        return sql_script, result_df
+    
+    try:
+        outcomes = await asyncio.gather(
+            *(_run(rule_dict) for rule_dict in rule_dicts),
+            return_exceptions=True
+        )
+    finally:
+        # Async pools are tied to this event loop, which asyncio.run closes when we return
+        dispose = getattr(connector, 'dispose_async', None)
+        if dispose is not None:
+            await dispose()
+    
+    validation_results: List[Optional[ValidationResult]] = [None] * len(rules)
+    executed = []
+    for i, (rule, outcome) in enumerate(zip(rules, outcomes)):
+        if isinstance(outcome, Exception):
+            console.print(f"❌ [red]Error processing rule '{rule.name}': {str(outcome)}[/red]")
+            validation_results[i] = ValidationResult(
+                rule_name=rule.name,
+                rule_id=rule.id,
+                status="ERROR",
+                error_message=str(outcome)
+            )
+        else:
+            sql_script, result_df = outcome
+            if result_df.empty:
+                validation_results[i] = build_validation_result(rule, sql_script, None)
+            else:
+                executed.append((i, rule, sql_script, result_df.head(1)))
+    
+    # Parse all returned rows in one pass instead of one Series per rule
+    if executed:
+        indices, executed_rules, sql_scripts, frames = zip(*executed)
+        combined_df = pd.concat(frames, ignore_index=True)
+        for i, result in zip(indices, build_validation_results(executed_rules, sql_scripts, combined_df)):
+            validation_results[i] = result
+    
+    return validation_results
+
+def build_validation_results(rules: List[ValidationRule], sql_scripts: List[str],
+                             result_df: pd.DataFrame) -> List[ValidationResult]:
+    """Convert a result set holding one row per rule into ValidationResults"""
+    def _counts(column: str) -> np.ndarray:
+        if column not in result_df.columns:
+            return np.zeros(len(result_df), dtype=np.int64)
+        return result_df[column].fillna(0).to_numpy(dtype=np.int64)
+    
+    statuses = result_df['status'].to_numpy() if 'status' in result_df.columns else np.full(len(result_df), None)
+    totals = _counts('total_rows')
+    fails = _counts('failed_rows')
+    passes = _counts('passed_rows')
+    rows = result_df.to_dict('records')
+    
+    return [
+        ValidationResult(
+            rule_name=rule.name,
+            rule_id=rule.id,
+            status="PASS" if status == 'PASS' else "FAIL",
+            total_rows=int(total),
+            failed_rows=int(failed),
+            passed_rows=int(passed),
+            generated_sql=sql_script,
+            details={'sql_result': {k: v for k, v in row.items() if not pd.isna(v)}}
+        )
+        for rule, sql_script, status, total, failed, passed, row
+        in zip(rules, sql_scripts, statuses, totals, fails, passes, rows)
+    ]
+
+def display_sql_validation_results(results: List[ValidationResult], quiet: bool = False):
     """Display SQL validation results with generated scripts"""
+    if quiet or not console.is_terminal:
+        # Compact line-oriented summary for logs/CI: status, rule, total rows, failed rows
+        for result in results:
+            print(f"{result.status}\t{result.rule_name}\t{result.total_rows}\t{result.failed_rows}")
+        return
+    
     console.print("\n📋 [bold blue]Validation Results[/bold blue]")
     
     for result in results:
-        status_color = "green" if result.status == "PASS" else "red" if result.status == "FAIL" else "yellow"
-        status_icon = "✅" if result.status == "PASS" else "❌" if result.status == "FAIL" else "⚠️"
+        status_color, status_icon = STATUS_STYLES.get(result.status, DEFAULT_STATUS_STYLE)
         
         console.print(f"\n{status_icon} [bold]{result.rule_name}[/bold]")
         console.print(f"   Status: [{status_color}]{result.status}[/{status_color}]")
@@ -852,60 +1118,121 @@ def display_sql_validation_results(results: List[ValidationResult]):
             console.print("   [bold cyan]Generated SQL:[/bold cyan]")
             # Create a panel with the SQL code
             sql_panel = Panel(
-                Syntax(result.generated_sql, "sql", theme="monokai", line_numbers=True),
+                Syntax(
+                    result.generated_sql, "sql", theme="monokai", line_numbers=True,
+                    code_width=120, word_wrap=False,
+                    background_color="default" if len(result.generated_sql) > LARGE_SQL_CHARS else None
+                ),
                 title="SQL Script",
                 border_style="cyan"
             )
             console.print(sql_panel)
 
-def save_sql_scripts(results: List[ValidationResult], table_name: str):
-    """Save generated SQL scripts to files"""
+def write_sql_file(sql_file: Tuple[Path, bytes]):
+    """Write an encoded SQL script with unbuffered OS-level I/O"""
+    path, payload = sql_file
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(payload)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
+
+def save_sql_scripts(results: List[ValidationResult], table_name: str, split_files: bool = False,
+                     include_sql_in_json: bool = False, parallel_io: bool = False,
+                     zip_sql_files: bool = False):
+    """Save generated SQL scripts and the JSON results report in a single pass"""
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     
     # Create outputs directory if it doesn't exist
     outputs_dir = Path("outputs")
     outputs_dir.mkdir(exist_ok=True)
     
-    # Save individual SQL files
-    for i, result in enumerate(results):
-        if result.generated_sql:
-            sql_filename = f"validation_sql_{table_name}_{result.rule_name.replace(' ', '_')}_{timestamp}.sql"
-            sql_path = outputs_dir / sql_filename
-            
-            with open(sql_path, 'w') as f:
-                f.write(f"-- Validation Rule: {result.rule_name}\n")
-                f.write(f"-- Generated on: {datetime.now().isoformat()}\n")
-                f.write(f"-- Table: {table_name}\n")
-                f.write(f"-- Status: {result.status}\n\n")
-                f.write(result.generated_sql)
+    json_path = outputs_dir / f"sql_validation_results_{table_name}_{timestamp}.json"
+    combined_sql_path = outputs_dir / f"validation_sql_{table_name}_{timestamp}.sql"
+    sql_archive_path = outputs_dir / f"validation_sql_{table_name}_{timestamp}.zip"
+    saved_sql_paths = []
+    pending_writes = []
+    
+    with ExitStack() as stack:
+        json_file = stack.enter_context(open(json_path, 'wb'))
+        executor = stack.enter_context(ThreadPoolExecutor(max_workers=8)) if split_files and parallel_io else None
+        combined_sql_file = None
+        sql_archive = None
+        
+        # Stream the report header; each result record is appended as its SQL is written
+        json_file.write(b"{\n")
+        json_file.write(b'  "table_name": ' + orjson.dumps(table_name) + b',\n')
+        json_file.write(b'  "generation_timestamp": ' + orjson.dumps(timestamp) + b',\n')
+        json_file.write(b'  "total_rules": ' + orjson.dumps(len(results)) + b',\n')
+        json_file.write(b'  "results": [')
+        
+        for i, result in enumerate(results):
+            sql_path = None
+            sql_member = None
+            if result.generated_sql and (split_files or zip_sql_files):
+                sql_filename = f"validation_sql_{table_name}_{result.rule_name.replace(' ', '_')}_{timestamp}.sql"
+                payload = (
+                    f"-- Validation Rule: {result.rule_name}\n"
+                    f"-- Generated on: {datetime.now().isoformat()}\n"
+                    f"-- Table: {table_name}\n"
+                    f"-- Status: {result.status}\n\n"
+                    f"{result.generated_sql}"
+                ).encode('utf-8')
+                if zip_sql_files:
+                    # One compressed archive instead of one file per rule
+                    sql_path = sql_archive_path
+                    sql_member = sql_filename
+                    if sql_archive is None:
+                        sql_archive = stack.enter_context(zipfile.ZipFile(sql_archive_path, 'w', zipfile.ZIP_DEFLATED))
+                        saved_sql_paths.append(sql_archive_path)
+                    sql_archive.writestr(sql_filename, payload)
+                else:
+                    sql_path = outputs_dir / sql_filename
+                    if executor:
+                        # Overlap filesystem latency across files; os.write releases the GIL
+                        pending_writes.append(executor.submit(write_sql_file, (sql_path, payload)))
+                    else:
+                        write_sql_file((sql_path, payload))
+                    saved_sql_paths.append(sql_path)
+            elif result.generated_sql:
+                sql_path = combined_sql_path
+                if combined_sql_file is None:
+                    combined_sql_file = stack.enter_context(open(combined_sql_path, 'w'))
+                    combined_sql_file.write(f"-- Generated on: {datetime.now().isoformat()}\n")
+                    combined_sql_file.write(f"-- Table: {table_name}\n")
+                combined_sql_file.write(f"\n-- === {result.rule_name} ({result.status}) ===\n{result.generated_sql}\n")
             
-            console.print(f"💾 SQL script saved: {sql_path}")
-    
-    # Save combined results JSON
-    results_data = {
-        'table_name': table_name,
-        'generation_timestamp': timestamp,
-        'total_rules': len(results),
-        'results': [
-            {
-                'rule_name': r.rule_name,
-                'status': r.status,
-                'total_rows': r.total_rows,
-                'failed_rows': r.failed_rows,
-                'passed_rows': r.passed_rows,
-                'error_message': r.error_message,
-                'generated_sql': r.generated_sql
+            result_entry = {
+                'rule_name': result.rule_name,
+                'status': result.status,
+                'total_rows': result.total_rows,
+                'failed_rows': result.failed_rows,
+                'passed_rows': result.passed_rows,
+                'error_message': result.error_message,
+                'sql_path': str(sql_path) if sql_path else None
             }
-            for r in results
-        ]
-    }
-    
-    json_filename = f"sql_validation_results_{table_name}_{timestamp}.json"
-    json_path = outputs_dir / json_filename
-    
-    with open(json_path, 'w') as f:
-        json.dump(results_data, f, indent=2, default=str)
+            if sql_member:
+                result_entry['sql_member'] = sql_member
+            if include_sql_in_json:
+                result_entry['generated_sql'] = result.generated_sql
+            
+            json_file.write(b"," if i else b"")
+            json_file.write(b"\n    " + orjson.dumps(result_entry, default=str))
+        
+        json_file.write(b"\n  ]\n}\n")
+        
+        # Surface any failed background write
+        for future in pending_writes:
+            future.result()
+        
+        if combined_sql_file is not None:
+            saved_sql_paths.append(combined_sql_path)
     
+    for sql_path in saved_sql_paths:
+        console.print(f"💾 SQL script saved: {sql_path}")
     console.print(f"💾 Results saved: {json_path}")
 
 if __name__ == "__main__":
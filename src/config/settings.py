@@ -16,6 +16,7 @@ class Settings(BaseSettings):
     postgres_db: Optional[str] = "vpengine"
     postgres_user: Optional[str] = "vpuser"
     postgres_password: Optional[str] = "vppass123"
+    postgres_async: bool = False  # run validation queries through asyncpg (requires the asyncpg package)
     
     # MySQL settings
     mysql_host: Optional[str] = "localhost"
@@ -24,6 +25,32 @@ class Settings(BaseSettings):
     mysql_user: Optional[str] = "vpuser"
     mysql_password: Optional[str] = "vppass123"
     
+    # Connection pool settings (shared by the PostgreSQL and MySQL connectors)
+    db_pool_size: int = 20
+    db_max_overflow: int = 40
+    db_pool_recycle: int = 1800
+    
+    # Optional ConnectorX reader for SQL query results (requires the connectorx package)
+    use_connectorx: bool = False
+    cx_partitions: int = 4
+    
+    # Optional ADBC reader that fetches PostgreSQL results straight into Arrow (requires adbc-driver-postgresql)
+    use_adbc: bool = False
+    
+    # CSV engine: "pandas" loads the file into memory, "polars" scans it lazily (requires the polars package)
+    csv_engine: str = "pandas"
+    # Downcast numeric columns and store repetitive text as categorical when pandas parses the CSV
+    csv_auto_downcast: bool = True
+    
+    # Column profiling: above this estimated row count, distinct counts come from planner statistics, which
+    # can be stale (MySQL index cardinality especially); 0 keeps every count exact
+    approx_distinct_threshold: int = 0
+    
+    # Generated SQL cache on disk: empty directory disables it; entries expire after the TTL (seconds)
+    sql_cache_dir: str = "~/.cache/vp-engine/sql"
+    sql_cache_ttl: int = 86400
+    sql_cache_max_entries: int = 10_000
+    
     # AWS settings
     aws_access_key_id: Optional[str] = None
     aws_secret_access_key: Optional[str] = None
@@ -55,6 +82,10 @@ class Settings(BaseSettings):
     def POSTGRES_PASSWORD(self):
         return self.postgres_password
     
+    @property
+    def POSTGRES_ASYNC(self):
+        return self.postgres_async
+    
     @property
     def MYSQL_HOST(self):
         return self.mysql_host
@@ -75,6 +106,54 @@ class Settings(BaseSettings):
     def MYSQL_PASSWORD(self):
         return self.mysql_password
     
+    @property
+    def DB_POOL_SIZE(self):
+        return self.db_pool_size
+    
+    @property
+    def DB_MAX_OVERFLOW(self):
+        return self.db_max_overflow
+    
+    @property
+    def DB_POOL_RECYCLE(self):
+        return self.db_pool_recycle
+    
+    @property
+    def USE_CONNECTORX(self):
+        return self.use_connectorx
+    
+    @property
+    def CX_PARTITIONS(self):
+        return self.cx_partitions
+    
+    @property
+    def USE_ADBC(self):
+        return self.use_adbc
+    
+    @property
+    def CSV_ENGINE(self):
+        return self.csv_engine
+    
+    @property
+    def CSV_AUTO_DOWNCAST(self):
+        return self.csv_auto_downcast
+    
+    @property
+    def APPROX_DISTINCT_THRESHOLD(self):
+        return self.approx_distinct_threshold
+    
+    @property
+    def SQL_CACHE_DIR(self):
+        return self.sql_cache_dir
+    
+    @property
+    def SQL_CACHE_TTL(self):
+        return self.sql_cache_ttl
+    
+    @property
+    def SQL_CACHE_MAX_ENTRIES(self):
+        return self.sql_cache_max_entries
+    
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
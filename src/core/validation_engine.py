@@ -3,11 +3,19 @@ VP Engine - Core Validation Engine
 SQL-based data validation engine that generates parameterized SQL scripts
 """
 import json
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+import orjson
 import pandas as pd
+from string import Template
 from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
 import re
+import tempfile
+import time
 from datetime import datetime
 import sys
 from pathlib import Path
@@ -19,13 +27,136 @@ from models.validation import (
     SQLGenerationContext
 )
 
+# Part of the on-disk SQL cache key; bump whenever generated SQL changes for the same rule
+SQL_GENERATOR_VERSION = "1.2.0"
+
+# Maximum number of generated SQL scripts kept in memory per engine (least recently used evicted)
+SQL_MEMORY_CACHE_SIZE = 1024
+
+# On-disk SQL cache defaults: entries older than the TTL (seconds) are regenerated, oldest pruned past the cap
+SQL_DISK_CACHE_TTL = 86400
+SQL_DISK_CACHE_MAX_ENTRIES = 10_000
+
+# Regex mismatch predicate per dialect; other databases fall back to REGEXP_LIKE
+REGEX_CONDITION_TEMPLATES = {
+    DataSourceType.POSTGRESQL: "${column} !~ '${pattern}'",
+    DataSourceType.MYSQL: "${column} NOT REGEXP '${pattern}'",
+    # CSV sources are queried through DuckDB, whose regexp_matches is a partial match like PostgreSQL's ~
+    DataSourceType.CSV: "NOT regexp_matches(${column}, '${pattern}')",
+}
+DEFAULT_REGEX_CONDITION_TEMPLATE = "NOT REGEXP_LIKE(${column}, '${pattern}')"
+
+# Regex mismatch predicate for query engines whose SQL differs from their source type's default
+QUERY_ENGINE_REGEX_CONDITION_TEMPLATES = {
+    # Polars SQL has regexp_like (partial match) but no regexp_matches
+    "polars": "NOT regexp_like(${column}, '${pattern}')",
+}
+
+# Dialect-independent SQL skeletons, compiled once and shared by every engine instance
+INCREMENTAL_CONTINUITY_SQL = Template("""
+WITH sequence_check AS (
+    SELECT 
+        ${column},
+        LAG(${column}) OVER (ORDER BY ${column}) as prev_value,
+        ROW_NUMBER() OVER (ORDER BY ${column}) as expected_sequence
+    FROM ${table_ref}
+    WHERE ${column} IS NOT NULL
+),
+gaps AS (
+    SELECT COUNT(*) as gap_count
+    FROM sequence_check
+    WHERE ${column} != prev_value + 1 AND prev_value IS NOT NULL
+)
+SELECT 
+    '${rule_name}' as rule_name,
+    (SELECT COUNT(*) FROM ${table_ref}) as total_rows,
+    (SELECT gap_count FROM gaps) as failed_rows,
+    (SELECT COUNT(*) FROM ${table_ref}) - (SELECT gap_count FROM gaps) as passed_rows,
+    CASE 
+        WHEN (SELECT gap_count FROM gaps) = 0 THEN 'PASS'
+        ELSE 'FAIL'
+    END as status;
+""")
+
+TIMESTAMP_CONTINUITY_SQL = Template("""
+WITH timestamp_gaps AS (
+    SELECT 
+        COUNT(*) as gap_count
+    FROM (
+        SELECT 
+            ${column},
+            LAG(${column}) OVER (ORDER BY ${column}) as prev_timestamp,
+            EXTRACT(EPOCH FROM (${column} - LAG(${column}) OVER (ORDER BY ${column}))) as time_diff
+        FROM ${table_ref}
+        WHERE ${column} IS NOT NULL
+    ) t
+    WHERE time_diff > ${max_gap_seconds}
+)
+SELECT 
+    '${rule_name}' as rule_name,
+    (SELECT COUNT(*) FROM ${table_ref}) as total_rows,
+    (SELECT gap_count FROM timestamp_gaps) as failed_rows,
+    (SELECT COUNT(*) FROM ${table_ref}) - (SELECT gap_count FROM timestamp_gaps) as passed_rows,
+    CASE 
+        WHEN (SELECT gap_count FROM timestamp_gaps) = 0 THEN 'PASS'
+        ELSE 'FAIL'
+    END as status;
+""")
+
+STATISTICAL_COMPARISON_SQL = Template("""WITH stats1 AS (
+    SELECT ${stat1_expr} as stat_value
+    FROM ${table1_ref}
+    ${filter1}
+),
+stats2 AS (
+    SELECT ${stat2_expr} as stat_value
+    FROM ${table2_ref}
+    ${filter2}
+),
+comparison AS (
+    SELECT 
+        s1.stat_value as table1_stat,
+        s2.stat_value as table2_stat,
+        CASE 
+            WHEN s1.stat_value ${operator} s2.stat_value THEN 'PASS'
+            ELSE 'FAIL'
+        END as status
+    FROM stats1 s1, stats2 s2
+)
+SELECT 
+    '${rule_name}' as rule_name,
+    1 as total_rows,
+    CASE WHEN status = 'FAIL' THEN 1 ELSE 0 END as failed_rows,
+    CASE WHEN status = 'PASS' THEN 1 ELSE 0 END as passed_rows,
+    status,
+    table1_stat,
+    table2_stat
+FROM comparison;""")
+
+# One scan answering several single-column rules: total_rows plus a failed_rule_<i> count per rule
+FUSED_COLUMN_SQL = Template("""SELECT 
+    COUNT(*) as total_rows,
+${failed_counts}
+FROM ${table_ref}
+WHERE ${column} IS NOT NULL;""")
+
+STATIC_SQL_TEMPLATES: Dict[str, Template] = {
+    'data_continuity:incremental': INCREMENTAL_CONTINUITY_SQL,
+    'data_continuity:timestamp': TIMESTAMP_CONTINUITY_SQL,
+    'statistical_comparison': STATISTICAL_COMPARISON_SQL,
+    'fused_column': FUSED_COLUMN_SQL,
+}
+
 class ValidationStatus(Enum):
     PASSED = "passed"
     FAILED = "failed"
     WARNING = "warning"
     ERROR = "error"
 
-@dataclass 
+# dataclass(slots=True) needs Python 3.10+; older interpreters keep a per-instance __dict__
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class RuleValidationSummary:
     total_rules: int
     passed_rules: int
@@ -38,157 +169,240 @@ class RuleValidationSummary:
 class SQLValidationEngine:
     """SQL-based validation engine that generates parameterized SQL scripts"""
     
-    def __init__(self, context: SQLGenerationContext):
+    def __init__(
+        self,
+        context: SQLGenerationContext,
+        cache_dir: Optional[Path] = None,
+        cache_ttl: int = SQL_DISK_CACHE_TTL,
+        cache_max_entries: int = SQL_DISK_CACHE_MAX_ENTRIES
+    ):
         self.context = context
         self.database_type = context.database_type
+        # Compiled SQL templates keyed by rule type (and variant); rules only substitute values
+        self._template_cache: Dict[str, Template] = {}
+        # Formatted table references keyed by (schema, table) after context defaults are applied
+        self._table_ref_cache: Dict[Tuple[Optional[str], str], str] = {}
+        # Generated SQL persisted across runs, keyed by a hash of the rule and target table
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.cache_ttl = cache_ttl
+        self.cache_max_entries = cache_max_entries
+        if self.cache_dir is not None:
+            self._prune_disk_cache()
+        # In-process LRU in front of the disk cache; rules may be generated from worker threads
+        self._sql_cache: "OrderedDict[str, str]" = OrderedDict()
+        self._sql_cache_lock = threading.Lock()
+        # The dialect is fixed per engine, so pick its regex predicate once
+        self.query_engine = getattr(context, 'query_engine', None)
+        self._regex_condition = Template(
+            QUERY_ENGINE_REGEX_CONDITION_TEMPLATES.get(self.query_engine)
+            or REGEX_CONDITION_TEMPLATES.get(self.database_type, DEFAULT_REGEX_CONDITION_TEMPLATE)
+        )
+        # Single-column rule type value -> failure condition builder; the per-rule template and
+        # column fusion both substitute these conditions
+        self._condition_builders = {
+            RuleType.VALUE_RANGE.value: self._value_range_condition,
+            RuleType.VALUE_TEMPLATE.value: self._value_template_condition,
+        }
+        # Rule type value -> SQL generator, so dispatch is a single dict lookup
+        self._sql_generators = {
+            RuleType.VALUE_RANGE.value: self._generate_value_range_sql,
+            RuleType.VALUE_TEMPLATE.value: self._generate_value_template_sql,
+            RuleType.DATA_CONTINUITY.value: self._generate_data_continuity_sql,
+            RuleType.SAME_STATISTICAL_COMPARISON.value: self._generate_same_statistical_comparison_sql,
+            RuleType.DIFFERENT_STATISTICAL_COMPARISON.value: self._generate_different_statistical_comparison_sql,
+        }
         
     def generate_validation_sql(self, rule: Dict[str, Any]) -> str:
+        """Generate SQL script for a validation rule, reusing cached SQL for identical rules"""
+        key = self._sql_cache_key(rule)
+        with self._sql_cache_lock:
+            sql = self._sql_cache.get(key)
+            if sql is not None:
+                self._sql_cache.move_to_end(key)
+                return sql
+        
+        sql = self._load_or_generate_sql(rule, key)
+        
+        with self._sql_cache_lock:
+            self._sql_cache[key] = sql
+            if len(self._sql_cache) > SQL_MEMORY_CACHE_SIZE:
+                self._sql_cache.popitem(last=False)
+        return sql
+    
+    def _load_or_generate_sql(self, rule: Dict[str, Any], key: str) -> str:
+        """Read the rule's SQL from the on-disk cache if enabled, generating and storing it on a miss"""
+        if self.cache_dir is None:
+            return self._generate_validation_sql(rule)
+        
+        cache_path = self.cache_dir / f"{key}.sql"
+        try:
+            if time.time() - cache_path.stat().st_mtime < self.cache_ttl:
+                return cache_path.read_text(encoding='utf-8')
+        except OSError:
+            pass
+        
+        sql = self._generate_validation_sql(rule)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # Write to a uniquely named file then rename, so concurrent writers never share or read a partial file
+            with tempfile.NamedTemporaryFile(
+                'w', encoding='utf-8', dir=self.cache_dir, suffix='.tmp', delete=False
+            ) as tmp_file:
+                tmp_file.write(sql)
+            os.replace(tmp_file.name, cache_path)
+        except OSError:
+            pass
+        return sql
+    
+    def _prune_disk_cache(self) -> None:
+        """Drop expired or orphaned cache files, then the oldest entries beyond the size cap"""
+        try:
+            entries = []
+            now = time.time()
+            for path in self.cache_dir.iterdir():
+                if path.suffix not in ('.sql', '.tmp'):
+                    continue
+                mtime = path.stat().st_mtime
+                if now - mtime >= self.cache_ttl:
+                    # Also clears temp files left behind by writers that died before the rename
+                    path.unlink(missing_ok=True)
+                elif path.suffix == '.sql':
+                    entries.append((mtime, path))
+            
+            entries.sort()
+            for _, path in entries[:max(len(entries) - self.cache_max_entries, 0)]:
+                path.unlink(missing_ok=True)
+        except OSError:
+            # A missing or unreadable cache directory only costs regeneration
+            pass
+    
+    def _sql_cache_key(self, rule: Dict[str, Any]) -> str:
+        """Hash the rule together with everything else that shapes its SQL"""
+        key_data = orjson.dumps(rule, option=orjson.OPT_SORT_KEYS, default=str)
+        key_data += "|".join([
+            str(self.database_type), str(self.query_engine), self._get_table_reference(), SQL_GENERATOR_VERSION
+        ]).encode()
+        return hashlib.blake2b(key_data, digest_size=20).hexdigest()
+    
+    def _generate_validation_sql(self, rule: Dict[str, Any]) -> str:
         """Generate SQL script for a validation rule"""
         rule_type = rule.get('rule_type') or rule.get('type')
         
-        if rule_type == RuleType.VALUE_RANGE or rule_type == 'value_range':
-            return self._generate_value_range_sql(rule)
-        elif rule_type == RuleType.VALUE_TEMPLATE or rule_type == 'value_template':
-            return self._generate_value_template_sql(rule)
-        elif rule_type == RuleType.DATA_CONTINUITY or rule_type == 'data_continuity':
-            return self._generate_data_continuity_sql(rule)
-        elif rule_type == RuleType.SAME_STATISTICAL_COMPARISON or rule_type == 'same_statistical_comparison':
-            return self._generate_same_statistical_comparison_sql(rule)
-        elif rule_type == RuleType.DIFFERENT_STATISTICAL_COMPARISON or rule_type == 'different_statistical_comparison':
-            return self._generate_different_statistical_comparison_sql(rule)
-        else:
+        # Enum members (from either copy of the models module) and plain strings share one key
+        generator = self._sql_generators.get(getattr(rule_type, 'value', rule_type))
+        if generator is None:
             raise ValueError(f"Unsupported rule type: {rule_type}")
+        return generator(rule)
     
     def _get_table_reference(self, table_name: str = None, schema: str = None) -> str:
         """Generate properly formatted table reference"""
         schema = schema or self.context.schema_name
         table = table_name or self.context.table_name
         
-        if schema:
-            return f"{schema}.{table}"
-        return table
+        key = (schema, table)
+        table_ref = self._table_ref_cache.get(key)
+        if table_ref is None:
+            table_ref = f"{schema}.{table}" if schema else table
+            self._table_ref_cache[key] = table_ref
+        return table_ref
     
-    def _generate_value_range_sql(self, rule: Dict[str, Any]) -> str:
-        """Generate SQL for value range validation (Rule Type 1)"""
+    def _get_template(self, key: str) -> Template:
+        """Return the compiled SQL template for a rule type, building it on first use"""
+        template = self._template_cache.get(key)
+        if template is None:
+            template = STATIC_SQL_TEMPLATES.get(key) or Template(self._build_template_text(key))
+            self._template_cache[key] = template
+        return template
+    
+    def _build_template_text(self, key: str) -> str:
+        """Build the dialect-specific SQL template text for a single-column rule type"""
+        if key not in ('value_range', 'value_template'):
+            raise ValueError(f"No SQL template for: {key}")
+        condition = "${condition}"
+        
+        # Single-column checks share the same shape and differ only in the failure condition,
+        # which is evaluated once per row in the CTE and reused for the derived columns
+        return f"""
+WITH counts AS (
+    SELECT 
+        COUNT(*) as total_rows,
+        {self._count_where(condition)} as failed_rows
+    FROM ${{table_ref}}
+    WHERE ${{column}} IS NOT NULL
+)
+SELECT 
+    '${{rule_name}}' as rule_name,
+    total_rows,
+    failed_rows,
+    total_rows - failed_rows as passed_rows,
+    CASE 
+        WHEN failed_rows = 0 THEN 'PASS'
+        ELSE 'FAIL'
+    END as status
+FROM counts;
+"""
+    
+    def _count_where(self, condition: str) -> str:
+        """Aggregate counting the rows that match condition, in the dialect's cheapest form"""
+        if self.database_type == DataSourceType.POSTGRESQL:
+            return f"COUNT(*) FILTER (WHERE {condition})"
+        return f"SUM(CASE WHEN ({condition}) THEN 1 ELSE 0 END)"
+    
+    def _value_range_condition(self, rule: Dict[str, Any]) -> str:
+        """Build the failure condition for a value range rule"""
         column = rule['target_column']
         params = rule.get('parameters', {})
         min_val = params.get('min_value')
         max_val = params.get('max_value')
         
-        table_ref = self._get_table_reference()
-        
         conditions = []
         if min_val is not None:
             conditions.append(f"{column} < {min_val}")
         if max_val is not None:
             conditions.append(f"{column} > {max_val}")
         
-        where_clause = " OR ".join(conditions) if conditions else "1=0"
-        
-        sql = f"""
-SELECT 
-    '{rule.get('name', 'Value Range Check')}' as rule_name,
-    COUNT(*) as total_rows,
-    SUM(CASE WHEN ({where_clause}) THEN 1 ELSE 0 END) as failed_rows,
-    COUNT(*) - SUM(CASE WHEN ({where_clause}) THEN 1 ELSE 0 END) as passed_rows,
-    CASE 
-        WHEN SUM(CASE WHEN ({where_clause}) THEN 1 ELSE 0 END) = 0 THEN 'PASS'
-        ELSE 'FAIL'
-    END as status
-FROM {table_ref}
-WHERE {column} IS NOT NULL;
-"""
-        return sql.strip()
+        return " OR ".join(conditions) if conditions else "1=0"
     
-    def _generate_value_template_sql(self, rule: Dict[str, Any]) -> str:
-        """Generate SQL for regex template validation (Rule Type 2)"""
+    def _value_template_condition(self, rule: Dict[str, Any]) -> str:
+        """Build the failure condition for a regex template rule"""
         column = rule['target_column']
         params = rule.get('parameters', {})
         pattern = params.get('pattern') or params.get('regex_pattern', '.*')
         
-        table_ref = self._get_table_reference()
-        
-        if self.database_type == DataSourceType.POSTGRESQL:
-            regex_condition = f"{column} !~ '{pattern}'"
-        elif self.database_type == DataSourceType.MYSQL:
-            regex_condition = f"{column} NOT REGEXP '{pattern}'"
-        else:
-            regex_condition = f"NOT REGEXP_LIKE({column}, '{pattern}')"
-        
-        sql = f"""
-SELECT 
-    '{rule.get('name', 'Value Template Check')}' as rule_name,
-    COUNT(*) as total_rows,
-    SUM(CASE WHEN ({regex_condition}) THEN 1 ELSE 0 END) as failed_rows,
-    COUNT(*) - SUM(CASE WHEN ({regex_condition}) THEN 1 ELSE 0 END) as passed_rows,
-    CASE 
-        WHEN SUM(CASE WHEN ({regex_condition}) THEN 1 ELSE 0 END) = 0 THEN 'PASS'
-        ELSE 'FAIL'
-    END as status
-FROM {table_ref}
-WHERE {column} IS NOT NULL;
-"""
+        return self._regex_condition.substitute(column=column, pattern=pattern)
+    
+    def _generate_single_column_sql(self, rule: Dict[str, Any], rule_type: str, default_name: str) -> str:
+        """Generate SQL for a rule checked by a per-row failure condition on one column"""
+        sql = self._get_template(rule_type).substitute(
+            rule_name=rule.get('name', default_name),
+            condition=self._condition_builders[rule_type](rule),
+            table_ref=self._get_table_reference(),
+            column=rule['target_column']
+        )
         return sql.strip()
     
+    def _generate_value_range_sql(self, rule: Dict[str, Any]) -> str:
+        """Generate SQL for value range validation (Rule Type 1)"""
+        return self._generate_single_column_sql(rule, RuleType.VALUE_RANGE.value, 'Value Range Check')
+    
+    def _generate_value_template_sql(self, rule: Dict[str, Any]) -> str:
+        """Generate SQL for regex template validation (Rule Type 2)"""
+        return self._generate_single_column_sql(rule, RuleType.VALUE_TEMPLATE.value, 'Value Template Check')
+    
     def _generate_data_continuity_sql(self, rule: Dict[str, Any]) -> str:
         """Generate SQL for data continuity validation (Rule Type 3)"""
         column = rule['target_column']
         params = rule.get('parameters', {})
         sequence_type = params.get('sequence_type', 'incremental')
         
-        table_ref = self._get_table_reference()
-        
-        if sequence_type == 'incremental':
-            sql = f"""
-WITH sequence_check AS (
-    SELECT 
-        {column},
-        LAG({column}) OVER (ORDER BY {column}) as prev_value,
-        ROW_NUMBER() OVER (ORDER BY {column}) as expected_sequence
-    FROM {table_ref}
-    WHERE {column} IS NOT NULL
-),
-gaps AS (
-    SELECT COUNT(*) as gap_count
-    FROM sequence_check
-    WHERE {column} != prev_value + 1 AND prev_value IS NOT NULL
-)
-SELECT 
-    '{rule.get('name', 'Data Continuity Check')}' as rule_name,
-    (SELECT COUNT(*) FROM {table_ref}) as total_rows,
-    (SELECT gap_count FROM gaps) as failed_rows,
-    (SELECT COUNT(*) FROM {table_ref}) - (SELECT gap_count FROM gaps) as passed_rows,
-    CASE 
-        WHEN (SELECT gap_count FROM gaps) = 0 THEN 'PASS'
-        ELSE 'FAIL'
-    END as status;
-"""
-        else:
-            sql = f"""
-WITH timestamp_gaps AS (
-    SELECT 
-        COUNT(*) as gap_count
-    FROM (
-        SELECT 
-            {column},
-            LAG({column}) OVER (ORDER BY {column}) as prev_timestamp,
-            EXTRACT(EPOCH FROM ({column} - LAG({column}) OVER (ORDER BY {column}))) as time_diff
-        FROM {table_ref}
-        WHERE {column} IS NOT NULL
-    ) t
-    WHERE time_diff > {params.get('max_gap_seconds', 3600)}
-)
-SELECT 
-    '{rule.get('name', 'Data Continuity Check')}' as rule_name,
-    (SELECT COUNT(*) FROM {table_ref}) as total_rows,
-    (SELECT gap_count FROM timestamp_gaps) as failed_rows,
-    (SELECT COUNT(*) FROM {table_ref}) - (SELECT gap_count FROM timestamp_gaps) as passed_rows,
-    CASE 
-        WHEN (SELECT gap_count FROM timestamp_gaps) = 0 THEN 'PASS'
-        ELSE 'FAIL'
-    END as status;
-"""
+        template_key = 'data_continuity:incremental' if sequence_type == 'incremental' else 'data_continuity:timestamp'
         
+        sql = self._get_template(template_key).substitute(
+            rule_name=rule.get('name', 'Data Continuity Check'),
+            table_ref=self._get_table_reference(),
+            column=column,
+            max_gap_seconds=params.get('max_gap_seconds', 3600)
+        )
         return sql.strip()
     
     def _generate_same_statistical_comparison_sql(self, rule: Dict[str, Any]) -> str:
@@ -221,35 +435,16 @@ SELECT
             function_sql1 = f"{function}({column1})"
             function_sql2 = f"{function}({column2})"
         
-        sql = f"""WITH stats1 AS (
-    SELECT {function_sql1} as stat_value
-    FROM {table1_ref}
-    {f"WHERE {table1.get('filter')}" if table1.get('filter') else ""}
-),
-stats2 AS (
-    SELECT {function_sql2} as stat_value
-    FROM {table2_ref}
-    {f"WHERE {table2.get('filter')}" if table2.get('filter') else ""}
-),
-comparison AS (
-    SELECT 
-        s1.stat_value as table1_stat,
-        s2.stat_value as table2_stat,
-        CASE 
-            WHEN s1.stat_value {operator} s2.stat_value THEN 'PASS'
-            ELSE 'FAIL'
-        END as status
-    FROM stats1 s1, stats2 s2
-)
-SELECT 
-    '{rule.get('name', 'Same Statistical Comparison')}' as rule_name,
-    1 as total_rows,
-    CASE WHEN status = 'FAIL' THEN 1 ELSE 0 END as failed_rows,
-    CASE WHEN status = 'PASS' THEN 1 ELSE 0 END as passed_rows,
-    status,
-    table1_stat,
-    table2_stat
-FROM comparison;"""
+        sql = self._get_template('statistical_comparison').substitute(
+            rule_name=rule.get('name', 'Same Statistical Comparison'),
+            stat1_expr=function_sql1,
+            table1_ref=table1_ref,
+            filter1=f"WHERE {table1.get('filter')}" if table1.get('filter') else "",
+            stat2_expr=function_sql2,
+            table2_ref=table2_ref,
+            filter2=f"WHERE {table2.get('filter')}" if table2.get('filter') else "",
+            operator=operator
+        )
         return sql.strip()
     
     def _generate_different_statistical_comparison_sql(self, rule: Dict[str, Any]) -> str:
@@ -284,42 +479,103 @@ FROM comparison;"""
             
         columns2_expr = f"{function2}({columns2[0]})"
         
-        sql = f"""WITH stats1 AS (
-    SELECT {columns1_expr} as stat_value
-    FROM {table1_ref}
-    WHERE {table1.get('filter', '1=1')}
-),
-stats2 AS (
-    SELECT {columns2_expr} as stat_value
-    FROM {table2_ref}
-    WHERE {table2.get('filter', '1=1')}
-),
-comparison AS (
-    SELECT 
-        s1.stat_value as table1_stat,
-        s2.stat_value as table2_stat,
-        CASE 
-            WHEN s1.stat_value {operator} s2.stat_value THEN 'PASS'
-            ELSE 'FAIL'
-        END as status
-    FROM stats1 s1, stats2 s2
-)
-SELECT 
-    '{rule.get('name', 'Different Statistical Comparison')}' as rule_name,
-    1 as total_rows,
-    CASE WHEN status = 'FAIL' THEN 1 ELSE 0 END as failed_rows,
-    CASE WHEN status = 'PASS' THEN 1 ELSE 0 END as passed_rows,
-    status,
-    table1_stat,
-    table2_stat
-FROM comparison;"""
+        sql = self._get_template('statistical_comparison').substitute(
+            rule_name=rule.get('name', 'Different Statistical Comparison'),
+            stat1_expr=columns1_expr,
+            table1_ref=table1_ref,
+            filter1=f"WHERE {table1.get('filter', '1=1')}",
+            stat2_expr=columns2_expr,
+            table2_ref=table2_ref,
+            filter2=f"WHERE {table2.get('filter', '1=1')}",
+            operator=operator
+        )
         return sql.strip()
     
+    def fuse_rules_by_column(self, rule_dicts: List[Dict[str, Any]]) -> Dict[str, Tuple[List[int], str]]:
+        """Fuse value range/template rules on the same column into one scan per column.
+        
+        Returns ``column -> (rule indices, fused SQL)``. Each fused query returns ``total_rows``
+        and one ``failed_rule_<i>`` count per rule, where ``i`` is the rule's index in
+        ``rule_dicts``. Columns with a single such rule are not fused.
+        """
+        checks_by_column: Dict[str, List[Tuple[int, str]]] = {}
+        for i, rule in enumerate(rule_dicts):
+            rule_type = rule.get('rule_type') or rule.get('type')
+            build_condition = self._condition_builders.get(getattr(rule_type, 'value', rule_type))
+            if build_condition is None:
+                continue
+            checks_by_column.setdefault(rule['target_column'], []).append((i, build_condition(rule)))
+        
+        table_ref = self._get_table_reference()
+        fused = {}
+        for column in sorted(checks_by_column):
+            checks = checks_by_column[column]
+            if len(checks) < 2:
+                continue
+            
+            fused_sql = self._get_template('fused_column').substitute(
+                failed_counts=",\n".join(
+                    f"    {self._count_where(condition)} as failed_rule_{i}"
+                    for i, condition in checks
+                ),
+                table_ref=table_ref,
+                column=column
+            )
+            fused[column] = ([i for i, _ in checks], fused_sql)
+        
+        return fused
+    
+    def generate_batched_validation_sql(
+        self,
+        rule_sqls: Dict[str, str],
+        fused: Optional[Dict[str, Tuple[List[int], str]]] = None
+    ) -> str:
+        """Combine generated rule SQL (keyed by rule id) into a single UNION ALL query.
+        
+        Fused scans from ``fuse_rules_by_column`` become CTEs that contribute one row per
+        rule, with ``rule_id`` set to the rule's index, so they share the same round trip.
+        """
+        ctes = []
+        parts = []
+        for n, (indices, fused_sql) in enumerate((fused or {}).values()):
+            ctes.append(f"""fused_{n} AS (
+{fused_sql.strip().rstrip(';')}
+)""")
+            for i in indices:
+                failed = f"COALESCE(failed_rule_{i}, 0)"
+                parts.append(f"""SELECT 
+    '{i}' as rule_id,
+    CASE WHEN {failed} = 0 THEN 'PASS' ELSE 'FAIL' END as status,
+    total_rows,
+    {failed} as failed_rows,
+    total_rows - {failed} as passed_rows
+FROM fused_{n}""")
+        
+        for rule_id, sql in rule_sqls.items():
+            parts.append(f"""SELECT 
+    '{rule_id}' as rule_id,
+    status,
+    total_rows,
+    failed_rows,
+    passed_rows
+FROM (
+{sql.strip().rstrip(';')}
+) _r""")
+        
+        with_clause = "WITH " + ",\n".join(ctes) + "\n" if ctes else ""
+        return with_clause + "\nUNION ALL\n".join(parts) + ";"
+    
     def generate_complex_rule_sql(self, complex_rule: ComplexRule) -> str:
         """Generate SQL for complex boolean rule combinations"""
         rule_sqls = {}
         for rule_id, rule in complex_rule.rules.items():
-            rule_dict = rule.dict() if hasattr(rule, 'dict') else rule
+            # Only these fields shape the SQL; reading them directly skips a full model serialization
+            rule_dict = rule if isinstance(rule, dict) else {
+                'name': rule.name,
+                'rule_type': rule.rule_type,
+                'target_column': rule.target_column,
+                'parameters': rule.parameters
+            }
             rule_sqls[rule_id] = self.generate_validation_sql(rule_dict)
         
         expression = complex_rule.expression
@@ -1,21 +1,168 @@
+import numpy as np
+import os
+import threading
+from collections import OrderedDict
 import pandas as pd
 import sqlalchemy
 from sqlalchemy import create_engine, text, inspect
 import pymysql
 import psycopg2
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, Iterator, List, Optional, Sequence, Union
+from datetime import date, datetime, time
+from decimal import Decimal
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import structlog
 from pathlib import Path
 
-from ..models.validation import DataSourceConfig, DataSourceType, ColumnInfo
+from ..models.validation import DataSourceConfig, DataSourceType, ColumnInfo, ColumnInfoFrame
 from ..config.settings import settings
 
 logger = structlog.get_logger()
 
+# Rows per DataFrame when streaming query results from a server-side cursor
+QUERY_CHUNK_SIZE = 50_000
+
+# Connectors kept by DatabaseManager for reuse, keyed by source type, connection params and file
+CONNECTOR_CACHE_SIZE = 64
+_connector_cache: "OrderedDict[Any, DatabaseConnector]" = OrderedDict()
+_connector_cache_lock = threading.Lock()
+
+# Rows read in one batch during column profiling; every column's sample values come from this batch
+PROFILE_SAMPLE_ROWS = 1000
+
+@lru_cache(maxsize=1)
+def _load_connectorx():
+    """Import connectorx once; None if it is not installed"""
+    try:
+        import connectorx
+        return connectorx
+    except ImportError:
+        logger.warning("USE_CONNECTORX is enabled but connectorx is not installed; using SQLAlchemy")
+        return None
+
+def _plain_database_url(connection_string: str) -> str:
+    """Strip the SQLAlchemy driver suffix (postgresql+psycopg2:// -> postgresql://) for native readers"""
+    scheme, rest = connection_string.split('://', 1)
+    return f"{scheme.split('+')[0]}://{rest}"
+
+def _read_sql_connectorx(connection_string: str, query: str, partition_on: Optional[str] = None,
+                         return_type: str = "pandas") -> Optional[Union[pd.DataFrame, "pyarrow.Table"]]:
+    """Read a query straight into pandas (or Arrow) buffers with ConnectorX, or None if it is disabled/unavailable"""
+    if not settings.USE_CONNECTORX:
+        return None
+    cx = _load_connectorx()
+    if cx is None:
+        return None
+    
+    options = {}
+    if partition_on:
+        options = {'partition_on': partition_on, 'partition_num': settings.CX_PARTITIONS}
+    return cx.read_sql(_plain_database_url(connection_string), query, return_type=return_type, **options)
+
+@lru_cache(maxsize=1)
+def _load_adbc_postgresql():
+    """Import the ADBC PostgreSQL driver once; None if it is not installed"""
+    try:
+        import adbc_driver_postgresql.dbapi
+        return adbc_driver_postgresql.dbapi
+    except ImportError:
+        logger.warning("USE_ADBC is enabled but adbc-driver-postgresql is not installed; using SQLAlchemy")
+        return None
+
+def _read_arrow_adbc(connection_string: str, query: str) -> Optional["pyarrow.Table"]:
+    """Fetch a PostgreSQL query result directly into a pyarrow Table over ADBC, or None if it is disabled/unavailable"""
+    if not settings.USE_ADBC:
+        return None
+    adbc = _load_adbc_postgresql()
+    if adbc is None:
+        return None
+    
+    with adbc.connect(_plain_database_url(connection_string)) as conn:
+        with conn.cursor() as cursor:
+            cursor.execute(query)
+            return cursor.fetch_arrow_table()
+
+def _quote_identifier(engine: sqlalchemy.engine.Engine, name: str) -> str:
+    """Quote a table or column name (schema-qualified names part by part) for interpolation into SQL text"""
+    preparer = engine.dialect.identifier_preparer
+    return ".".join(preparer.quote(part) for part in name.split("."))
+
+@lru_cache(maxsize=1)
+def _load_pyarrow():
+    """Import the pyarrow CSV reader and compute kernels once; None if pyarrow is not installed"""
+    try:
+        import pyarrow.csv
+        import pyarrow.compute
+        return pyarrow
+    except ImportError:
+        return None
+
+@lru_cache(maxsize=1)
+def _load_duckdb():
+    """Import duckdb once; None if it is not installed"""
+    try:
+        import duckdb
+        return duckdb
+    except ImportError:
+        return None
+
+@lru_cache(maxsize=1)
+def _load_polars():
+    """Import polars once; None if it is not installed"""
+    try:
+        import polars
+        return polars
+    except ImportError:
+        return None
+
+def _arrow_data_type(arrow_type) -> str:
+    """Classify an Arrow type as numeric/datetime/text, matching the pandas dtype checks"""
+    types = _load_pyarrow().types
+    if types.is_integer(arrow_type) or types.is_floating(arrow_type) or types.is_decimal(arrow_type):
+        return "numeric"
+    if types.is_timestamp(arrow_type) or types.is_date(arrow_type):
+        return "datetime"
+    return "text"
+
+def _profile_scalar(value: Any) -> Any:
+    """Coerce a min/max statistic to a type ColumnInfo declares (int, float, str or datetime).
+    
+    Frames build ColumnInfo with model_construct, so this replaces the coercion validation used to do.
+    """
+    if isinstance(value, np.generic):
+        value = value.item()
+    if value is None or isinstance(value, (int, float, str)):
+        return value
+    if value is pd.NA or value is pd.NaT:
+        return None
+    if isinstance(value, pd.Timestamp):
+        return value.to_pydatetime()
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, date):
+        return datetime.combine(value, time.min)
+    if isinstance(value, Decimal):
+        return float(value)
+    # TIME, INTERVAL, UUID and other database types have no declared equivalent
+    return str(value)
+
+def _engine_pool_options() -> Dict[str, Any]:
+    """QueuePool sizing for SQL connectors, large enough for concurrent rule execution"""
+    return {
+        'pool_size': settings.DB_POOL_SIZE,
+        'max_overflow': settings.DB_MAX_OVERFLOW,
+        'pool_pre_ping': True,
+        'pool_recycle': settings.DB_POOL_RECYCLE,
+    }
+
 class DatabaseConnector(ABC):
     """Abstract base class for database connections"""
     
+    # Engine that executes SQL for sources that are not databases themselves; None means the database runs it
+    query_engine: Optional[str] = None
+    
     @abstractmethod
     def connect(self) -> bool:
         """Establish connection to the database"""
@@ -27,7 +174,7 @@ class DatabaseConnector(ABC):
         pass
     
     @abstractmethod
-    def get_columns(self, table_name: str) -> List[ColumnInfo]:
+    def get_columns(self, table_name: str) -> Sequence[ColumnInfo]:
         """Get column information for a table"""
         pass
     
@@ -36,15 +183,42 @@ class DatabaseConnector(ABC):
         """Get sample data from table"""
         pass
     
+    @abstractmethod
+    def get_sample_values(self, table_name: str, columns: List[str],
+                          per_column_limit: int = 10) -> Dict[str, List[Any]]:
+        """Get up to per_column_limit non-null values for each column"""
+        pass
+    
     @abstractmethod
     def execute_query(self, query: str) -> pd.DataFrame:
         """Execute SQL query and return results"""
         pass
     
+    def supports_sql_execution(self) -> bool:
+        """Whether execute_query/execute_scalar_row actually run SQL against this source"""
+        return True
+    
+    def execute_query_arrow(self, query: str) -> "pyarrow.Table":
+        """Execute query and return the result as a pyarrow Table (requires pyarrow)"""
+        pa = _load_pyarrow()
+        if pa is None:
+            raise ImportError("execute_query_arrow requires the pyarrow package")
+        return pa.Table.from_pandas(self.execute_query(query), preserve_index=False)
+    
+    @abstractmethod
+    def execute_scalar_row(self, query: str) -> Optional[Dict[str, Any]]:
+        """Execute SQL query and return its first row as a dict, or None if empty"""
+        pass
+    
     @abstractmethod
     def get_data_profile(self, table_name: str, column_name: str) -> Dict[str, Any]:
         """Get data profile statistics for a column"""
         pass
+    
+    @abstractmethod
+    def disconnect(self) -> None:
+        """Release the connection and drop cached metadata"""
+        pass
 
 class PostgreSQLConnector(DatabaseConnector):
     """PostgreSQL database connector"""
@@ -53,6 +227,10 @@ class PostgreSQLConnector(DatabaseConnector):
         self.config = config
         self.engine = None
         self.connection_string = self._build_connection_string()
+        # Metadata cache for the lifetime of the connection
+        self._tables_cache: Optional[List[str]] = None
+        self._columns_cache: Dict[str, ColumnInfoFrame] = {}
+        self._inspector = None
     
     def _build_connection_string(self) -> str:
         """Build PostgreSQL connection string"""
@@ -68,116 +246,322 @@ class PostgreSQLConnector(DatabaseConnector):
     def connect(self) -> bool:
         """Establish PostgreSQL connection"""
         try:
-            self.engine = create_engine(self.connection_string)
+            self.invalidate_cache()
+            # A reused connector keeps its engine, so reconnecting only checks out a pooled connection
+            if self.engine is None:
+                self.engine = create_engine(self.connection_string, **_engine_pool_options())
             # Test connection
             with self.engine.connect() as conn:
                 conn.execute(text("SELECT 1"))
-            logger.info("PostgreSQL connection established successfully")
+            logger.info("PostgreSQL connection established successfully", pool=self.engine.pool.status())
             return True
         except Exception as e:
-            logger.error(f"Failed to connect to PostgreSQL: {str(e)}")
+            logger.error("Failed to connect to PostgreSQL", error=str(e))
             return False
     
+    def disconnect(self) -> None:
+        """Dispose the PostgreSQL engine and clear cached metadata"""
+        if self.engine is not None:
+            self.engine.dispose()
+            self.engine = None
+        self.invalidate_cache()
+    
+    def invalidate_cache(self) -> None:
+        """Drop cached tables, columns and reflection data so the next call re-reads the catalog"""
+        self._tables_cache = None
+        self._columns_cache.clear()
+        self._inspector = None
+    
+    def _get_inspector(self):
+        """Return the connection's Inspector; it memoizes catalog queries across calls"""
+        if self._inspector is None:
+            self._inspector = inspect(self.engine)
+        return self._inspector
+    
     def get_tables(self) -> List[str]:
         """Get list of PostgreSQL tables"""
+        if self._tables_cache is not None:
+            return self._tables_cache
         try:
-            inspector = inspect(self.engine)
+            inspector = self._get_inspector()
             tables = inspector.get_table_names()
+            self._tables_cache = tables
             return tables
         except Exception as e:
-            logger.error(f"Failed to get tables: {str(e)}")
+            logger.error("Failed to get tables", error=str(e))
             return []
     
-    def get_columns(self, table_name: str) -> List[ColumnInfo]:
+    def get_columns(self, table_name: str) -> Sequence[ColumnInfo]:
         """Get PostgreSQL column information"""
+        if table_name in self._columns_cache:
+            return self._columns_cache[table_name]
         try:
-            inspector = inspect(self.engine)
+            inspector = self._get_inspector()
             columns = inspector.get_columns(table_name)
             
-            column_infos = []
-            for col in columns:
-                # Get additional statistics
-                stats = self.get_data_profile(table_name, col['name'])
-                
-                column_info = ColumnInfo(
-                    name=col['name'],
-                    data_type=str(col['type']),
-                    nullable=col['nullable'],
-                    unique_count=stats.get('unique_count'),
-                    null_count=stats.get('null_count'),
-                    min_value=stats.get('min_value'),
-                    max_value=stats.get('max_value'),
-                    sample_values=stats.get('sample_values', [])
-                )
-                column_infos.append(column_info)
+            names = [col['name'] for col in columns]
+            profiles = self._profile_columns(table_name, names)
+            stats = [profiles.get(name, {}) for name in names]
             
+            column_infos = ColumnInfoFrame(
+                names=names,
+                data_types=[str(col['type']) for col in columns],
+                nullable=[col['nullable'] for col in columns],
+                unique_counts=[stat.get('unique_count') for stat in stats],
+                null_counts=[stat.get('null_count') for stat in stats],
+                min_values=[_profile_scalar(stat.get('min_value')) for stat in stats],
+                max_values=[_profile_scalar(stat.get('max_value')) for stat in stats],
+                sample_values=[stat.get('sample_values', []) for stat in stats]
+            )
+            
+            self._columns_cache[table_name] = column_infos
             return column_infos
         except Exception as e:
-            logger.error(f"Failed to get columns for table {table_name}: {str(e)}")
+            logger.error("Failed to get columns", table=table_name, error=str(e))
             return []
     
     def get_sample_data(self, table_name: str, limit: int = 100) -> pd.DataFrame:
         """Get sample data from PostgreSQL table"""
         try:
-            query = f"SELECT * FROM {table_name} LIMIT {limit}"
-            return pd.read_sql_query(query, self.engine)
+            table = _quote_identifier(self.engine, table_name)
+            df = _read_sql_connectorx(self.connection_string, f"SELECT * FROM {table} LIMIT {int(limit)}")
+            if df is not None:
+                return df
+            return pd.read_sql_query(text(f"SELECT * FROM {table} LIMIT :limit"), self.engine,
+                                     params={'limit': limit})
         except Exception as e:
-            logger.error(f"Failed to get sample data: {str(e)}")
+            logger.error("Failed to get sample data", error=str(e))
             return pd.DataFrame()
     
-    def execute_query(self, query: str) -> pd.DataFrame:
-        """Execute PostgreSQL query"""
+    def get_sample_values(self, table_name: str, columns: List[str],
+                          per_column_limit: int = 10) -> Dict[str, List[Any]]:
+        """Get non-null sample values for several PostgreSQL columns in one query"""
+        sample_values = {column: [] for column in columns}
+        if not columns:
+            return sample_values
+        
+        try:
+            table = _quote_identifier(self.engine, table_name)
+            query = "\nUNION ALL\n".join(
+                f"SELECT :col_{i} AS col, CAST({quoted} AS TEXT) AS val "
+                f"FROM (SELECT {quoted} FROM {table} WHERE {quoted} IS NOT NULL LIMIT :limit) x"
+                for i, quoted in enumerate(_quote_identifier(self.engine, column) for column in columns)
+            )
+            params = {f'col_{i}': column for i, column in enumerate(columns)}
+            params['limit'] = per_column_limit
+            with self.engine.connect() as conn:
+                for column, value in conn.execute(text(query), params):
+                    sample_values[column].append(value)
+            return sample_values
+        except Exception as e:
+            logger.error("Failed to get sample values", error=str(e))
+            return sample_values
+    
+    def execute_query(self, query: str, partition_on: Optional[str] = None) -> pd.DataFrame:
+        """Execute PostgreSQL query; partition_on splits the read across ConnectorX workers when enabled"""
+        try:
+            table = _read_arrow_adbc(self.connection_string, query)
+            if table is not None:
+                # self_destruct releases each Arrow buffer as soon as its column has been handed to pandas
+                return table.to_pandas(types_mapper=pd.ArrowDtype, self_destruct=True)
+            df = _read_sql_connectorx(self.connection_string, query, partition_on)
+            if df is not None:
+                return df
+            frames = list(self.execute_query_streaming(query))
+        except Exception as e:
+            logger.error("Query execution failed", error=str(e))
+            raise
+        
+        if not frames:
+            return pd.DataFrame()
+        return frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
+    
+    def execute_query_arrow(self, query: str) -> "pyarrow.Table":
+        """Execute PostgreSQL query into a pyarrow Table, natively over ADBC or ConnectorX when enabled"""
+        try:
+            table = _read_arrow_adbc(self.connection_string, query)
+            if table is None:
+                table = _read_sql_connectorx(self.connection_string, query, return_type="arrow")
+        except Exception as e:
+            logger.error("Query execution failed", error=str(e))
+            raise
+        return table if table is not None else super().execute_query_arrow(query)
+    
+    def execute_query_streaming(self, query: str, chunksize: int = QUERY_CHUNK_SIZE) -> Iterator[pd.DataFrame]:
+        """Execute PostgreSQL query on a server-side cursor, yielding DataFrames of up to chunksize rows"""
+        # stream_results keeps only one chunk of rows in client memory instead of the whole result set
+        with self.engine.connect().execution_options(stream_results=True) as conn:
+            result = conn.execute(text(query))
+            columns = list(result.keys())
+            for rows in result.partitions(chunksize):
+                yield pd.DataFrame.from_records(rows, columns=columns)
+    
+    def execute_scalar_row(self, query: str) -> Optional[Dict[str, Any]]:
+        """Execute PostgreSQL query and return only its first row"""
         try:
-            # Fix for SQLAlchemy immutabledict issue
             with self.engine.connect() as conn:
                 result = conn.execute(text(query))
-                # Convert to list of dicts to avoid immutabledict issues
-                rows = []
-                for row in result:
-                    # Convert immutabledict to regular dict
-                    row_dict = dict(row._mapping) if hasattr(row, '_mapping') else dict(row)
-                    rows.append(row_dict)
-                
-                # Create DataFrame from list of dicts
-                if rows:
-                    return pd.DataFrame(rows)
-                else:
-                    return pd.DataFrame()
+                row = result.fetchone()
+                return dict(zip(result.keys(), row)) if row is not None else None
         except Exception as e:
-            logger.error(f"Query execution failed: {str(e)}")
+            logger.error("Query execution failed", error=str(e))
             raise
     
     def get_data_profile(self, table_name: str, column_name: str) -> Dict[str, Any]:
         """Get PostgreSQL column statistics"""
         try:
             # Get basic statistics
+            table = _quote_identifier(self.engine, table_name)
+            column = _quote_identifier(self.engine, column_name)
+            approx_unique = self._approx_distinct_counts(table_name, [column_name])
+            unique_expr = 'NULL' if approx_unique else f'COUNT(DISTINCT {column})'
             stats_query = f"""
             SELECT 
                 COUNT(*) as total_count,
-                COUNT(DISTINCT {column_name}) as unique_count,
-                COUNT(*) - COUNT({column_name}) as null_count,
-                MIN({column_name}) as min_value,
-                MAX({column_name}) as max_value
-            FROM {table_name}
+                {unique_expr} as unique_count,
+                COUNT(*) - COUNT({column}) as null_count,
+                MIN({column}) as min_value,
+                MAX({column}) as max_value
+            FROM {table}
             """
             
-            stats_df = pd.read_sql_query(stats_query, self.engine)
+            stats_df = pd.read_sql_query(text(stats_query), self.engine)
             stats = stats_df.iloc[0].to_dict()
+            if approx_unique:
+                stats['unique_count'] = approx_unique[column_name]
             
             # Get sample values
             sample_query = f"""
-            SELECT DISTINCT {column_name} 
-            FROM {table_name} 
-            WHERE {column_name} IS NOT NULL 
-            LIMIT 10
+            SELECT DISTINCT {column} 
+            FROM {table} 
+            WHERE {column} IS NOT NULL 
+            LIMIT :limit
             """
-            sample_df = pd.read_sql_query(sample_query, self.engine)
-            stats['sample_values'] = sample_df[column_name].tolist()
+            sample_df = pd.read_sql_query(text(sample_query), self.engine, params={'limit': 10})
+            stats['sample_values'] = sample_df.iloc[:, 0].tolist()
             
             return stats
         except Exception as e:
-            logger.error(f"Failed to get data profile: {str(e)}")
+            logger.error("Failed to get data profile", error=str(e))
+            return {}
+    
+    def _approx_distinct_counts(self, table_name: str, column_names: List[str]) -> Dict[str, int]:
+        """Distinct-count estimates from pg_stats for tables above APPROX_DISTINCT_THRESHOLD rows"""
+        threshold = settings.APPROX_DISTINCT_THRESHOLD
+        if not threshold:
             return {}
+        
+        try:
+            with self.engine.connect() as conn:
+                row_estimate = conn.execute(
+                    text("SELECT reltuples FROM pg_class WHERE oid = to_regclass(:table)"),
+                    {'table': table_name}
+                ).scalar()
+                if row_estimate is None or row_estimate < threshold:
+                    return {}
+                rows = conn.execute(
+                    text("SELECT attname, n_distinct FROM pg_stats "
+                         "WHERE schemaname = current_schema() AND tablename = :table"),
+                    {'table': table_name}
+                )
+                # A negative n_distinct is a fraction of the row count rather than an absolute count
+                estimates = {name: int(n if n >= 0 else -n * row_estimate) for name, n in rows}
+        except Exception as e:
+            logger.warning("Approximate distinct counts unavailable, counting exactly", error=str(e))
+            return {}
+        
+        # Columns the planner has no statistics for yet keep the exact COUNT(DISTINCT)
+        return {column: estimates[column] for column in column_names if column in estimates}
+    
+    def _profile_columns(self, table_name: str, column_names: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Profile every column with one aggregate query and one sample query"""
+        if not column_names:
+            return {}
+        
+        try:
+            table = _quote_identifier(self.engine, table_name)
+            quoted = [_quote_identifier(self.engine, column) for column in column_names]
+            approx_unique = self._approx_distinct_counts(table_name, column_names)
+            stats_query = "SELECT \n    COUNT(*) as total_count,\n" + ",\n".join(
+                f"    {'NULL' if column in approx_unique else f'COUNT(DISTINCT {quoted[i]})'} as unique_count_{i}, "
+                f"COUNT(*) - COUNT({quoted[i]}) as null_count_{i}, "
+                f"MIN({quoted[i]}) as min_value_{i}, MAX({quoted[i]}) as max_value_{i}"
+                for i, column in enumerate(column_names)
+            ) + f"\nFROM {table}"
+            row = self.execute_scalar_row(stats_query) or {}
+            
+            # One LIMITed scan feeds every column's samples, instead of a DISTINCT subquery
+            # (a full hash/sort of the column) per column
+            sample_df = pd.read_sql_query(
+                text(f"SELECT {', '.join(quoted)} FROM {table} LIMIT :limit"), self.engine,
+                params={'limit': PROFILE_SAMPLE_ROWS}, dtype_backend='numpy_nullable'
+            )
+            sample_values = {
+                column: sample_df.iloc[:, i].dropna().drop_duplicates().head(10).tolist()
+                for i, column in enumerate(column_names)
+            }
+        except Exception as e:
+            # A column type the aggregates cannot handle fails the whole batch; profile one by one instead
+            logger.warning("Batched column profile failed, profiling per column", error=str(e))
+            return {column: self.get_data_profile(table_name, column) for column in column_names}
+        
+        return {
+            column: {
+                'total_count': row.get('total_count'),
+                'unique_count': approx_unique.get(column, row.get(f'unique_count_{i}')),
+                'null_count': row.get(f'null_count_{i}'),
+                'min_value': row.get(f'min_value_{i}'),
+                'max_value': row.get(f'max_value_{i}'),
+                'sample_values': sample_values[column]
+            }
+            for i, column in enumerate(column_names)
+        }
+
+class PostgreSQLAsyncConnector(PostgreSQLConnector):
+    """PostgreSQL connector that runs validation queries concurrently on an asyncpg AsyncEngine"""
+    
+    def __init__(self, config: DataSourceConfig):
+        super().__init__(config)
+        # Created inside the event loop that uses it; asyncpg connections cannot cross loops
+        self._async_engine = None
+    
+    def _get_async_engine(self):
+        """Return the AsyncEngine, creating it on first use in the running loop"""
+        if self._async_engine is None:
+            # Imported lazily: sqlalchemy.ext.asyncio needs greenlet, which sync-only installs may lack
+            from sqlalchemy.ext.asyncio import create_async_engine
+            self._async_engine = create_async_engine(
+                self.connection_string.replace("postgresql://", "postgresql+asyncpg://", 1),
+                **_engine_pool_options()
+            )
+        return self._async_engine
+    
+    async def execute_query_async(self, query: str) -> pd.DataFrame:
+        """Execute PostgreSQL query without blocking the event loop"""
+        try:
+            async with self._get_async_engine().connect() as conn:
+                result = await conn.execute(text(query))
+                columns = list(result.keys())
+                rows = result.fetchall()
+        except Exception as e:
+            logger.error("Query execution failed", error=str(e))
+            raise
+        
+        if not rows:
+            return pd.DataFrame()
+        return pd.DataFrame.from_records(rows, columns=columns)
+    
+    async def dispose_async(self) -> None:
+        """Close pooled asyncpg connections before their event loop ends"""
+        if self._async_engine is not None:
+            await self._async_engine.dispose()
+            self._async_engine = None
+    
+    def disconnect(self) -> None:
+        """Dispose the PostgreSQL engines and clear cached metadata"""
+        super().disconnect()
+        # Any async pool belonged to an event loop that has already finished
+        self._async_engine = None
 
 class MySQLConnector(DatabaseConnector):
     """MySQL database connector"""
@@ -186,6 +570,10 @@ class MySQLConnector(DatabaseConnector):
         self.config = config
         self.engine = None
         self.connection_string = self._build_connection_string()
+        # Metadata cache for the lifetime of the connection
+        self._tables_cache: Optional[List[str]] = None
+        self._columns_cache: Dict[str, ColumnInfoFrame] = {}
+        self._inspector = None
     
     def _build_connection_string(self) -> str:
         """Build MySQL connection string"""
@@ -201,166 +589,447 @@ class MySQLConnector(DatabaseConnector):
     def connect(self) -> bool:
         """Establish MySQL connection"""
         try:
-            self.engine = create_engine(self.connection_string)
+            self.invalidate_cache()
+            # A reused connector keeps its engine, so reconnecting only checks out a pooled connection
+            if self.engine is None:
+                self.engine = create_engine(self.connection_string, **_engine_pool_options())
             # Test connection
             with self.engine.connect() as conn:
                 conn.execute(text("SELECT 1"))
-            logger.info("MySQL connection established successfully")
+            logger.info("MySQL connection established successfully", pool=self.engine.pool.status())
             return True
         except Exception as e:
-            logger.error(f"Failed to connect to MySQL: {str(e)}")
+            logger.error("Failed to connect to MySQL", error=str(e))
             return False
     
+    def disconnect(self) -> None:
+        """Dispose the MySQL engine and clear cached metadata"""
+        if self.engine is not None:
+            self.engine.dispose()
+            self.engine = None
+        self.invalidate_cache()
+    
+    def invalidate_cache(self) -> None:
+        """Drop cached tables, columns and reflection data so the next call re-reads the catalog"""
+        self._tables_cache = None
+        self._columns_cache.clear()
+        self._inspector = None
+    
+    def _get_inspector(self):
+        """Return the connection's Inspector; it memoizes catalog queries across calls"""
+        if self._inspector is None:
+            self._inspector = inspect(self.engine)
+        return self._inspector
+    
     def get_tables(self) -> List[str]:
         """Get list of MySQL tables"""
+        if self._tables_cache is not None:
+            return self._tables_cache
         try:
-            inspector = inspect(self.engine)
+            inspector = self._get_inspector()
             tables = inspector.get_table_names()
+            self._tables_cache = tables
             return tables
         except Exception as e:
-            logger.error(f"Failed to get tables: {str(e)}")
+            logger.error("Failed to get tables", error=str(e))
             return []
     
-    def get_columns(self, table_name: str) -> List[ColumnInfo]:
+    def get_columns(self, table_name: str) -> Sequence[ColumnInfo]:
         """Get MySQL column information"""
+        if table_name in self._columns_cache:
+            return self._columns_cache[table_name]
         try:
-            inspector = inspect(self.engine)
+            inspector = self._get_inspector()
             columns = inspector.get_columns(table_name)
             
-            column_infos = []
-            for col in columns:
-                # Get additional statistics
-                stats = self.get_data_profile(table_name, col['name'])
-                
-                column_info = ColumnInfo(
-                    name=col['name'],
-                    data_type=str(col['type']),
-                    nullable=col['nullable'],
-                    unique_count=stats.get('unique_count'),
-                    null_count=stats.get('null_count'),
-                    min_value=stats.get('min_value'),
-                    max_value=stats.get('max_value'),
-                    sample_values=stats.get('sample_values', [])
-                )
-                column_infos.append(column_info)
+            names = [col['name'] for col in columns]
+            profiles = self._profile_columns(table_name, names)
+            stats = [profiles.get(name, {}) for name in names]
             
+            column_infos = ColumnInfoFrame(
+                names=names,
+                data_types=[str(col['type']) for col in columns],
+                nullable=[col['nullable'] for col in columns],
+                unique_counts=[stat.get('unique_count') for stat in stats],
+                null_counts=[stat.get('null_count') for stat in stats],
+                min_values=[_profile_scalar(stat.get('min_value')) for stat in stats],
+                max_values=[_profile_scalar(stat.get('max_value')) for stat in stats],
+                sample_values=[stat.get('sample_values', []) for stat in stats]
+            )
+            
+            self._columns_cache[table_name] = column_infos
             return column_infos
         except Exception as e:
-            logger.error(f"Failed to get columns for table {table_name}: {str(e)}")
+            logger.error("Failed to get columns", table=table_name, error=str(e))
             return []
     
     def get_sample_data(self, table_name: str, limit: int = 100) -> pd.DataFrame:
         """Get sample data from MySQL table"""
         try:
-            query = f"SELECT * FROM {table_name} LIMIT {limit}"
-            return pd.read_sql_query(query, self.engine)
+            table = _quote_identifier(self.engine, table_name)
+            df = _read_sql_connectorx(self.connection_string, f"SELECT * FROM {table} LIMIT {int(limit)}")
+            if df is not None:
+                return df
+            return pd.read_sql_query(text(f"SELECT * FROM {table} LIMIT :limit"), self.engine,
+                                     params={'limit': limit})
         except Exception as e:
-            logger.error(f"Failed to get sample data: {str(e)}")
+            logger.error("Failed to get sample data", error=str(e))
             return pd.DataFrame()
     
-    def execute_query(self, query: str) -> pd.DataFrame:
-        """Execute MySQL query"""
+    def get_sample_values(self, table_name: str, columns: List[str],
+                          per_column_limit: int = 10) -> Dict[str, List[Any]]:
+        """Get non-null sample values for several MySQL columns in one query"""
+        sample_values = {column: [] for column in columns}
+        if not columns:
+            return sample_values
+        
+        try:
+            table = _quote_identifier(self.engine, table_name)
+            query = "\nUNION ALL\n".join(
+                f"SELECT :col_{i} AS col, CAST({quoted} AS CHAR) AS val "
+                f"FROM (SELECT {quoted} FROM {table} WHERE {quoted} IS NOT NULL LIMIT :limit) x"
+                for i, quoted in enumerate(_quote_identifier(self.engine, column) for column in columns)
+            )
+            params = {f'col_{i}': column for i, column in enumerate(columns)}
+            params['limit'] = per_column_limit
+            with self.engine.connect() as conn:
+                for column, value in conn.execute(text(query), params):
+                    sample_values[column].append(value)
+            return sample_values
+        except Exception as e:
+            logger.error("Failed to get sample values", error=str(e))
+            return sample_values
+    
+    def execute_query(self, query: str, partition_on: Optional[str] = None) -> pd.DataFrame:
+        """Execute MySQL query; partition_on splits the read across ConnectorX workers when enabled"""
         try:
+            df = _read_sql_connectorx(self.connection_string, query, partition_on)
+            if df is not None:
+                return df
             return pd.read_sql_query(query, self.engine)
         except Exception as e:
-            logger.error(f"Query execution failed: {str(e)}")
+            logger.error("Query execution failed", error=str(e))
+            raise
+    
+    def execute_query_arrow(self, query: str) -> "pyarrow.Table":
+        """Execute MySQL query into a pyarrow Table, natively over ConnectorX when enabled"""
+        try:
+            table = _read_sql_connectorx(self.connection_string, query, return_type="arrow")
+        except Exception as e:
+            logger.error("Query execution failed", error=str(e))
+            raise
+        return table if table is not None else super().execute_query_arrow(query)
+    
+    def execute_scalar_row(self, query: str) -> Optional[Dict[str, Any]]:
+        """Execute MySQL query and return only its first row"""
+        try:
+            with self.engine.connect() as conn:
+                result = conn.execute(text(query))
+                row = result.fetchone()
+                return dict(zip(result.keys(), row)) if row is not None else None
+        except Exception as e:
+            logger.error("Query execution failed", error=str(e))
             raise
     
     def get_data_profile(self, table_name: str, column_name: str) -> Dict[str, Any]:
         """Get MySQL column statistics"""
         try:
             # Get basic statistics
+            table = _quote_identifier(self.engine, table_name)
+            column = _quote_identifier(self.engine, column_name)
+            approx_unique = self._approx_distinct_counts(table_name, [column_name])
+            unique_expr = 'NULL' if approx_unique else f'COUNT(DISTINCT {column})'
             stats_query = f"""
             SELECT 
                 COUNT(*) as total_count,
-                COUNT(DISTINCT {column_name}) as unique_count,
-                COUNT(*) - COUNT({column_name}) as null_count,
-                MIN({column_name}) as min_value,
-                MAX({column_name}) as max_value
-            FROM {table_name}
+                {unique_expr} as unique_count,
+                COUNT(*) - COUNT({column}) as null_count,
+                MIN({column}) as min_value,
+                MAX({column}) as max_value
+            FROM {table}
             """
             
-            stats_df = pd.read_sql_query(stats_query, self.engine)
+            stats_df = pd.read_sql_query(text(stats_query), self.engine)
             stats = stats_df.iloc[0].to_dict()
+            if approx_unique:
+                stats['unique_count'] = approx_unique[column_name]
             
             # Get sample values
             sample_query = f"""
-            SELECT DISTINCT {column_name} 
-            FROM {table_name} 
-            WHERE {column_name} IS NOT NULL 
-            LIMIT 10
+            SELECT DISTINCT {column} 
+            FROM {table} 
+            WHERE {column} IS NOT NULL 
+            LIMIT :limit
             """
-            sample_df = pd.read_sql_query(sample_query, self.engine)
-            stats['sample_values'] = sample_df[column_name].tolist()
+            sample_df = pd.read_sql_query(text(sample_query), self.engine, params={'limit': 10})
+            stats['sample_values'] = sample_df.iloc[:, 0].tolist()
             
             return stats
         except Exception as e:
-            logger.error(f"Failed to get data profile: {str(e)}")
+            logger.error("Failed to get data profile", error=str(e))
+            return {}
+    
+    def _approx_distinct_counts(self, table_name: str, column_names: List[str]) -> Dict[str, int]:
+        """Distinct-count estimates from index statistics for tables above APPROX_DISTINCT_THRESHOLD rows"""
+        threshold = settings.APPROX_DISTINCT_THRESHOLD
+        if not threshold:
+            return {}
+        
+        try:
+            with self.engine.connect() as conn:
+                row_estimate = conn.execute(
+                    text("SELECT TABLE_ROWS FROM information_schema.TABLES "
+                         "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table"),
+                    {'table': table_name}
+                ).scalar()
+                if row_estimate is None or row_estimate < threshold:
+                    return {}
+                # MySQL has no approximate COUNT(DISTINCT); index cardinality covers columns that lead an index
+                rows = conn.execute(
+                    text("SELECT COLUMN_NAME, MAX(CARDINALITY) FROM information_schema.STATISTICS "
+                         "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table AND SEQ_IN_INDEX = 1 "
+                         "GROUP BY COLUMN_NAME"),
+                    {'table': table_name}
+                )
+                estimates = {name: int(cardinality) for name, cardinality in rows if cardinality is not None}
+        except Exception as e:
+            logger.warning("Approximate distinct counts unavailable, counting exactly", error=str(e))
+            return {}
+        
+        return {column: estimates[column] for column in column_names if column in estimates}
+    
+    def _profile_columns(self, table_name: str, column_names: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Profile every column with one aggregate query and one sample query"""
+        if not column_names:
             return {}
+        
+        try:
+            table = _quote_identifier(self.engine, table_name)
+            quoted = [_quote_identifier(self.engine, column) for column in column_names]
+            approx_unique = self._approx_distinct_counts(table_name, column_names)
+            stats_query = "SELECT \n    COUNT(*) as total_count,\n" + ",\n".join(
+                f"    {'NULL' if column in approx_unique else f'COUNT(DISTINCT {quoted[i]})'} as unique_count_{i}, "
+                f"COUNT(*) - COUNT({quoted[i]}) as null_count_{i}, "
+                f"MIN({quoted[i]}) as min_value_{i}, MAX({quoted[i]}) as max_value_{i}"
+                for i, column in enumerate(column_names)
+            ) + f"\nFROM {table}"
+            row = self.execute_scalar_row(stats_query) or {}
+            
+            # One LIMITed scan feeds every column's samples, instead of a DISTINCT subquery
+            # (a full hash/sort of the column) per column
+            sample_df = pd.read_sql_query(
+                text(f"SELECT {', '.join(quoted)} FROM {table} LIMIT :limit"), self.engine,
+                params={'limit': PROFILE_SAMPLE_ROWS}, dtype_backend='numpy_nullable'
+            )
+            sample_values = {
+                column: sample_df.iloc[:, i].dropna().drop_duplicates().head(10).tolist()
+                for i, column in enumerate(column_names)
+            }
+        except Exception as e:
+            # A column type the aggregates cannot handle fails the whole batch; profile one by one instead
+            logger.warning("Batched column profile failed, profiling per column", error=str(e))
+            return {column: self.get_data_profile(table_name, column) for column in column_names}
+        
+        return {
+            column: {
+                'total_count': row.get('total_count'),
+                'unique_count': approx_unique.get(column, row.get(f'unique_count_{i}')),
+                'null_count': row.get(f'null_count_{i}'),
+                'min_value': row.get(f'min_value_{i}'),
+                'max_value': row.get(f'max_value_{i}'),
+                'sample_values': sample_values[column]
+            }
+            for i, column in enumerate(column_names)
+        }
 
 class CSVConnector(DatabaseConnector):
     """CSV file connector"""
     
+    query_engine = "duckdb"
+    
     def __init__(self, config: DataSourceConfig):
         self.config = config
         self.file_path = config.file_path
         self.df = None
+        # Arrow table behind self.df when pyarrow is installed; column stats run on it directly
+        self._table = None
+        # Column name -> "numeric"/"datetime"/"text", resolved once from the schema on load
+        self._data_types: Dict[str, str] = {}
+        self._columns_cache: Optional[ColumnInfoFrame] = None
+        # In-memory DuckDB connection with the CSV registered as a view (when duckdb is installed).
+        # One connection serves every thread, so queries on it are serialized by the lock.
+        self._duck = None
+        self._duck_lock = threading.Lock()
     
     def connect(self) -> bool:
         """Load CSV file"""
         try:
             if not self.file_path or not Path(self.file_path).exists():
-                logger.error(f"CSV file not found: {self.file_path}")
+                logger.error("CSV file not found", path=self.file_path)
                 return False
             
-            self.df = pd.read_csv(self.file_path)
-            logger.info(f"CSV file loaded successfully: {self.file_path}")
+            pa = _load_pyarrow()
+            if pa is not None:
+                # Multi-threaded C++ parser; the DataFrame wraps the Arrow buffers instead of copying them
+                self._table = pa.csv.read_csv(
+                    self.file_path,
+                    read_options=pa.csv.ReadOptions(use_threads=True, block_size=1 << 20),
+                    # Treat empty text fields as missing, as pd.read_csv does
+                    convert_options=pa.csv.ConvertOptions(strings_can_be_null=True)
+                )
+                self.df = self._table.to_pandas(types_mapper=pd.ArrowDtype)
+            else:
+                self._table = None
+                self.df = pd.read_csv(self.file_path)
+                if settings.CSV_AUTO_DOWNCAST:
+                    self._downcast_dtypes()
+            self._data_types = self._column_data_types()
+            self._columns_cache = None
+            self._close_duckdb()
+            logger.info("CSV file loaded successfully", path=self.file_path)
             return True
         except Exception as e:
-            logger.error(f"Failed to load CSV file: {str(e)}")
+            logger.error("Failed to load CSV file", error=str(e))
             return False
     
+    def _column_data_types(self) -> Dict[str, str]:
+        """Classify every column once; the Arrow schema answers directly without pandas dtype dispatch"""
+        if self._table is not None:
+            return {field.name: _arrow_data_type(field.type) for field in self._table.schema}
+        
+        data_types = {}
+        for col_name, dtype in self.df.dtypes.items():
+            if pd.api.types.is_numeric_dtype(dtype):
+                data_types[col_name] = "numeric"
+            elif pd.api.types.is_datetime64_any_dtype(dtype):
+                data_types[col_name] = "datetime"
+            else:
+                data_types[col_name] = "text"
+        return data_types
+    
+    def _downcast_dtypes(self, category_ratio: float = 0.5) -> None:
+        """Shrink the pandas-parsed columns: smallest int/float dtypes, categorical for repetitive text"""
+        for col_name in self.df.select_dtypes(include='integer').columns:
+            self.df[col_name] = pd.to_numeric(self.df[col_name], downcast='integer')
+        
+        for col_name in self.df.select_dtypes(include='floating').columns:
+            col_data = self.df[col_name]
+            downcast = pd.to_numeric(col_data, downcast='float')
+            # float32 cannot hold most decimals exactly; keep float64 unless every value survives the round trip
+            if downcast.dtype != col_data.dtype and np.array_equal(
+                    downcast.to_numpy(dtype=np.float64), col_data.to_numpy(), equal_nan=True):
+                self.df[col_name] = downcast
+        
+        if len(self.df):
+            for col_name in self.df.select_dtypes(include=['object', 'string']).columns:
+                col_data = self.df[col_name]
+                if col_data.nunique() / len(col_data) < category_ratio:
+                    self.df[col_name] = col_data.astype('category')
+    
+    def disconnect(self) -> None:
+        """Release the loaded CSV data"""
+        self._close_duckdb()
+        self.df = None
+        self._table = None
+        self._data_types = {}
+        self._columns_cache = None
+    
+    def _get_duckdb(self):
+        """Return a DuckDB connection with the CSV registered under its table name, or None"""
+        if self._duck is None:
+            duckdb = _load_duckdb()
+            if duckdb is None or self.df is None:
+                return None
+            self._duck = duckdb.connect(":memory:")
+            # Registering is zero-copy: DuckDB scans the Arrow table / DataFrame in place
+            self._duck.register(self.get_tables()[0], self._table if self._table is not None else self.df)
+        return self._duck
+    
+    def _require_duckdb(self):
+        """Return the DuckDB connection, raising when SQL cannot be executed on this CSV"""
+        duck = self._get_duckdb()
+        if duck is None:
+            raise RuntimeError("SQL execution unavailable for CSV files: install the duckdb package")
+        return duck
+    
+    def _close_duckdb(self) -> None:
+        """Close the DuckDB connection, if one was opened"""
+        if self._duck is not None:
+            self._duck.close()
+            self._duck = None
+    
     def get_tables(self) -> List[str]:
         """For CSV, return the filename as table name"""
         if self.file_path:
             return [Path(self.file_path).stem]
         return []
     
-    def get_columns(self, table_name: str = None) -> List[ColumnInfo]:
+    def get_columns(self, table_name: str = None) -> Sequence[ColumnInfo]:
         """Get CSV column information"""
-        if self.df is None:
+        # A CSV holds a single table named after the file, so one cached entry covers every call
+        if self.df is None or (table_name is not None and table_name not in self.get_tables()):
             return []
         
+        if self._columns_cache is not None:
+            return self._columns_cache
+        
         try:
-            column_infos = []
-            for col_name in self.df.columns:
-                col_data = self.df[col_name]
-                
-                # Determine data type
-                if pd.api.types.is_numeric_dtype(col_data):
-                    data_type = "numeric"
-                elif pd.api.types.is_datetime64_any_dtype(col_data):
-                    data_type = "datetime"
-                else:
-                    data_type = "text"
-                
-                column_info = ColumnInfo(
-                    name=col_name,
-                    data_type=data_type,
-                    nullable=col_data.isnull().any(),
-                    unique_count=col_data.nunique(),
-                    null_count=col_data.isnull().sum(),
-                    min_value=col_data.min() if pd.api.types.is_numeric_dtype(col_data) else None,
-                    max_value=col_data.max() if pd.api.types.is_numeric_dtype(col_data) else None,
-                    sample_values=col_data.dropna().unique()[:10].tolist()
-                )
-                column_infos.append(column_info)
+            # Columns are independent and the Arrow/pandas kernels release the GIL, so profile them concurrently
+            col_names = list(self.df.columns)
+            with ThreadPoolExecutor(max_workers=max(1, min(len(col_names), os.cpu_count() or 1))) as executor:
+                summaries = list(executor.map(self._column_summary, col_names))
+            
+            column_infos = ColumnInfoFrame(
+                names=col_names,
+                data_types=[self._data_types[col_name] for col_name in col_names],
+                nullable=[summary['null_count'] > 0 for summary in summaries],
+                unique_counts=[summary['unique_count'] for summary in summaries],
+                null_counts=[summary['null_count'] for summary in summaries],
+                min_values=[_profile_scalar(summary.get('min_value')) for summary in summaries],
+                max_values=[_profile_scalar(summary.get('max_value')) for summary in summaries],
+                sample_values=[summary['sample_values'] for summary in summaries]
+            )
             
+            self._columns_cache = column_infos
             return column_infos
         except Exception as e:
-            logger.error(f"Failed to get CSV columns: {str(e)}")
+            logger.error("Failed to get CSV columns", error=str(e))
             return []
     
+    def _column_summary(self, col_name: str, sample_limit: int = 10) -> Dict[str, Any]:
+        """Null count, distinct count, samples and numeric min/max for one column"""
+        col_data = self.df[col_name]
+        is_numeric = self._data_types[col_name] == "numeric"
+        
+        if self._table is not None:
+            pc = _load_pyarrow().compute
+            column = self._table.column(col_name)
+            # Arrow keeps the null count in the array metadata and unique() preserves first-seen order
+            uniques = pc.drop_null(pc.unique(column))
+            summary = {
+                'null_count': column.null_count,
+                'unique_count': len(uniques),
+                'sample_values': uniques[:sample_limit].to_pylist()
+            }
+            if is_numeric:
+                min_max = pc.min_max(column)
+                summary['min_value'] = min_max['min'].as_py()
+                summary['max_value'] = min_max['max'].as_py()
+            return summary
+        
+        # One hash pass over the column: factorize codes nulls as -1 and keeps the distinct
+        # non-null values in first-seen order, so every other stat comes from codes or uniques
+        codes, uniques = pd.factorize(col_data)
+        summary = {
+            'null_count': int(np.count_nonzero(codes < 0)),
+            'unique_count': len(uniques),
+            'sample_values': uniques[:sample_limit].tolist()
+        }
+        if is_numeric and len(uniques):
+            summary['min_value'] = uniques.min()
+            summary['max_value'] = uniques.max()
+        return summary
+    
     def get_sample_data(self, table_name: str = None, limit: int = 100) -> pd.DataFrame:
         """Get sample data from CSV"""
         if self.df is None:
@@ -368,16 +1037,60 @@ class CSVConnector(DatabaseConnector):
         
         return self.df.head(limit)
     
+    def get_sample_values(self, table_name: str = None, columns: List[str] = None,
+                          per_column_limit: int = 10) -> Dict[str, List[Any]]:
+        """Get non-null sample values for CSV columns"""
+        if self.df is None:
+            return {}
+        
+        sample_values = {}
+        for column in columns if columns is not None else self.df.columns:
+            if column in self.df.columns:
+                col_data = self.df[column]
+                sample_values[column] = col_data[col_data.notna()].head(per_column_limit).tolist()
+        return sample_values
+    
+    def supports_sql_execution(self) -> bool:
+        """CSV files can only be queried with SQL when DuckDB is installed"""
+        return _load_duckdb() is not None
+    
     def execute_query(self, query: str) -> pd.DataFrame:
-        """Execute query on CSV (limited SQL support via pandas)"""
-        # For CSV, we'll implement basic filtering
-        # This is a simplified implementation
+        """Execute SQL query on CSV with DuckDB"""
         if self.df is None:
             return pd.DataFrame()
         
-        # This would need more sophisticated query parsing
-        # For now, return the entire dataframe
-        return self.df
+        with self._duck_lock:
+            try:
+                return self._require_duckdb().execute(query).df()
+            except Exception as e:
+                logger.error("Query execution failed", error=str(e))
+                raise
+    
+    def execute_query_arrow(self, query: str) -> "pyarrow.Table":
+        """Execute SQL query on CSV with DuckDB into a pyarrow Table, without a pandas round trip"""
+        if self.df is None:
+            return super().execute_query_arrow(query)
+        
+        with self._duck_lock:
+            try:
+                return self._require_duckdb().execute(query).fetch_arrow_table()
+            except Exception as e:
+                logger.error("Query execution failed", error=str(e))
+                raise
+    
+    def execute_scalar_row(self, query: str) -> Optional[Dict[str, Any]]:
+        """Execute query on CSV and return its first row (same SQL support as execute_query)"""
+        if self.df is None:
+            return None
+        
+        with self._duck_lock:
+            try:
+                result = self._require_duckdb().execute(query)
+                row = result.fetchone()
+            except Exception as e:
+                logger.error("Query execution failed", error=str(e))
+                raise
+        return dict(zip([column[0] for column in result.description], row)) if row is not None else None
     
     def get_data_profile(self, table_name: str, column_name: str) -> Dict[str, Any]:
         """Get CSV column statistics"""
@@ -385,22 +1098,196 @@ class CSVConnector(DatabaseConnector):
             return {}
         
         try:
-            col_data = self.df[column_name]
+            stats = {'total_count': len(self.df)}
+            stats.update(self._column_summary(column_name))
+            return stats
+        except Exception as e:
+            logger.error("Failed to get CSV data profile", error=str(e))
+            return {}
+
+class PolarsCSVConnector(DatabaseConnector):
+    """CSV file connector backed by a lazy Polars scan, for files too large to load into pandas"""
+    
+    query_engine = "polars"
+    
+    def __init__(self, config: DataSourceConfig):
+        self.config = config
+        self.file_path = config.file_path
+        # Nothing is read until a query collects; Polars pushes projections and filters into the scan
+        self.lf = None
+        self._schema = None
+        self._columns_cache: Optional[ColumnInfoFrame] = None
+    
+    def connect(self) -> bool:
+        """Open a lazy scan over the CSV file"""
+        try:
+            pl = _load_polars()
+            if pl is None:
+                logger.error("The polars CSV engine requires the polars package")
+                return False
+            if not self.file_path or not Path(self.file_path).exists():
+                logger.error("CSV file not found", path=self.file_path)
+                return False
             
-            stats = {
-                'total_count': len(col_data),
-                'unique_count': col_data.nunique(),
-                'null_count': col_data.isnull().sum(),
-                'sample_values': col_data.dropna().unique()[:10].tolist()
+            self.lf = pl.scan_csv(self.file_path)
+            # Resolving the schema only parses the header and an inference sample, not the whole file
+            self._schema = self.lf.collect_schema()
+            self._columns_cache = None
+            logger.info("CSV file opened for lazy scanning", path=self.file_path)
+            return True
+        except Exception as e:
+            logger.error("Failed to load CSV file", error=str(e))
+            return False
+    
+    def disconnect(self) -> None:
+        """Drop the lazy scan"""
+        self.lf = None
+        self._schema = None
+        self._columns_cache = None
+    
+    def get_tables(self) -> List[str]:
+        """For CSV, return the filename as table name"""
+        if self.file_path:
+            return [Path(self.file_path).stem]
+        return []
+    
+    def _profile_columns(self, column_names: List[str], sample_limit: int = 10) -> Dict[str, Dict[str, Any]]:
+        """Row count, null/distinct counts, numeric min/max and samples for columns in one lazy pass"""
+        pl = _load_polars()
+        exprs = [pl.len().alias('total_count')]
+        for i, name in enumerate(column_names):
+            col = pl.col(name)
+            exprs += [
+                col.null_count().alias(f'null_count_{i}'),
+                col.drop_nulls().n_unique().alias(f'unique_count_{i}'),
+                col.drop_nulls().unique(maintain_order=True).head(sample_limit).implode().alias(f'sample_values_{i}')
+            ]
+            if self._schema[name].is_numeric():
+                exprs += [col.min().alias(f'min_value_{i}'), col.max().alias(f'max_value_{i}')]
+        row = self.lf.select(exprs).collect().row(0, named=True)
+        
+        return {
+            name: {
+                'total_count': row['total_count'],
+                'null_count': row[f'null_count_{i}'],
+                'unique_count': row[f'unique_count_{i}'],
+                'min_value': row.get(f'min_value_{i}'),
+                'max_value': row.get(f'max_value_{i}'),
+                'sample_values': row[f'sample_values_{i}']
             }
+            for i, name in enumerate(column_names)
+        }
+    
+    def get_columns(self, table_name: str = None) -> Sequence[ColumnInfo]:
+        """Get CSV column information"""
+        if self.lf is None or (table_name is not None and table_name not in self.get_tables()):
+            return []
+        
+        if self._columns_cache is not None:
+            return self._columns_cache
+        
+        try:
+            names = list(self._schema.names())
+            profiles = self._profile_columns(names)
+            stats = [profiles[name] for name in names]
+            
+            data_types = []
+            for dtype in self._schema.dtypes():
+                if dtype.is_numeric():
+                    data_types.append("numeric")
+                elif dtype.is_temporal():
+                    data_types.append("datetime")
+                else:
+                    data_types.append("text")
             
-            if pd.api.types.is_numeric_dtype(col_data):
-                stats['min_value'] = col_data.min()
-                stats['max_value'] = col_data.max()
+            column_infos = ColumnInfoFrame(
+                names=names,
+                data_types=data_types,
+                nullable=[stat['null_count'] > 0 for stat in stats],
+                unique_counts=[stat['unique_count'] for stat in stats],
+                null_counts=[stat['null_count'] for stat in stats],
+                min_values=[_profile_scalar(stat['min_value']) for stat in stats],
+                max_values=[_profile_scalar(stat['max_value']) for stat in stats],
+                sample_values=[stat['sample_values'] for stat in stats]
+            )
             
-            return stats
+            self._columns_cache = column_infos
+            return column_infos
+        except Exception as e:
+            logger.error("Failed to get CSV columns", error=str(e))
+            return []
+    
+    def get_sample_data(self, table_name: str = None, limit: int = 100) -> pd.DataFrame:
+        """Get sample data from CSV, reading only the first rows"""
+        if self.lf is None:
+            return pd.DataFrame()
+        
+        return self.lf.head(limit).collect().to_pandas()
+    
+    def get_sample_values(self, table_name: str = None, columns: List[str] = None,
+                          per_column_limit: int = 10) -> Dict[str, List[Any]]:
+        """Get non-null sample values for CSV columns"""
+        if self.lf is None:
+            return {}
+        
+        pl = _load_polars()
+        columns = [column for column in (columns if columns is not None else self._schema.names())
+                   if column in self._schema]
+        if not columns:
+            return {}
+        row = self.lf.select(
+            pl.col(column).drop_nulls().head(per_column_limit).implode() for column in columns
+        ).collect().row(0, named=True)
+        return {column: row[column] for column in columns}
+    
+    def _execute_lazy(self, query: str):
+        """Plan query with Polars SQL against the lazy scan, registered under the table name"""
+        pl = _load_polars()
+        return pl.SQLContext({self.get_tables()[0]: self.lf}).execute(query)
+    
+    def execute_query(self, query: str) -> pd.DataFrame:
+        """Execute SQL query on CSV with the Polars SQL engine"""
+        if self.lf is None:
+            return pd.DataFrame()
+        
+        try:
+            return self._execute_lazy(query).collect().to_pandas()
         except Exception as e:
-            logger.error(f"Failed to get CSV data profile: {str(e)}")
+            logger.error("Query execution failed", error=str(e))
+            raise
+    
+    def execute_query_arrow(self, query: str) -> "pyarrow.Table":
+        """Execute SQL query on CSV into a pyarrow Table"""
+        if self.lf is None:
+            return super().execute_query_arrow(query)
+        
+        try:
+            return self._execute_lazy(query).collect().to_arrow()
+        except Exception as e:
+            logger.error("Query execution failed", error=str(e))
+            raise
+    
+    def execute_scalar_row(self, query: str) -> Optional[Dict[str, Any]]:
+        """Execute SQL query on CSV and return its first row"""
+        if self.lf is None:
+            return None
+        
+        try:
+            result = self._execute_lazy(query).head(1).collect()
+        except Exception as e:
+            logger.error("Query execution failed", error=str(e))
+            raise
+        return result.row(0, named=True) if result.height else None
+    
+    def get_data_profile(self, table_name: str, column_name: str) -> Dict[str, Any]:
+        """Get CSV column statistics"""
+        if self.lf is None or column_name not in self._schema:
+            return {}
+        
+        try:
+            return self._profile_columns([column_name])[column_name]
+        except Exception as e:
+            logger.error("Failed to get CSV data profile", error=str(e))
             return {}
 
 class DatabaseManager:
@@ -408,13 +1295,38 @@ class DatabaseManager:
     
     @staticmethod
     def create_connector(config: DataSourceConfig) -> DatabaseConnector:
+        """Return the connector for config, reusing (and keeping the engine of) one built for the same source"""
+        try:
+            key = (config.type, frozenset(config.connection_params.items()), config.file_path)
+            hash(key)
+        except TypeError:
+            # Unhashable connection params (nested dicts/lists) cannot be cached
+            return DatabaseManager._build_connector(config)
+        
+        with _connector_cache_lock:
+            connector = _connector_cache.get(key)
+            if connector is not None:
+                _connector_cache.move_to_end(key)
+                return connector
+            connector = DatabaseManager._build_connector(config)
+            _connector_cache[key] = connector
+            if len(_connector_cache) > CONNECTOR_CACHE_SIZE:
+                _connector_cache.popitem(last=False)
+            return connector
+    
+    @staticmethod
+    def _build_connector(config: DataSourceConfig) -> DatabaseConnector:
         """Create appropriate database connector based on config"""
         
         if config.type == DataSourceType.POSTGRESQL:
+            if config.connection_params.get('async', settings.POSTGRES_ASYNC):
+                return PostgreSQLAsyncConnector(config)
             return PostgreSQLConnector(config)
         elif config.type == DataSourceType.MYSQL:
             return MySQLConnector(config)
         elif config.type == DataSourceType.CSV:
+            if config.connection_params.get('engine', settings.CSV_ENGINE) == 'polars':
+                return PolarsCSVConnector(config)
             return CSVConnector(config)
         else:
             raise ValueError(f"Unsupported data source type: {config.type}")
@@ -426,5 +1338,5 @@ class DatabaseManager:
             connector = DatabaseManager.create_connector(config)
             return connector.connect()
         except Exception as e:
-            logger.error(f"Connection test failed: {str(e)}")
+            logger.error("Connection test failed", error=str(e))
             return False
\ No newline at end of file
@@ -1,5 +1,7 @@
 from pydantic import BaseModel, Field
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, Iterator, List, Optional, Union
+from collections.abc import Sequence
+from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime
 
@@ -25,6 +27,42 @@ class ColumnInfo(BaseModel):
     min_value: Optional[Union[int, float, str, datetime]] = None
     max_value: Optional[Union[int, float, str, datetime]] = None
 
+@dataclass
+class ColumnInfoFrame(Sequence):
+    """Column profiles of one table stored field by field (one list per ColumnInfo field).
+    
+    Reading names or data_types never builds a model; indexing and iteration yield ColumnInfo
+    objects created on demand with model_construct, which skips Pydantic validation.
+    """
+    names: List[str] = field(default_factory=list)
+    data_types: List[str] = field(default_factory=list)
+    nullable: List[bool] = field(default_factory=list)
+    unique_counts: List[Optional[int]] = field(default_factory=list)
+    null_counts: List[Optional[int]] = field(default_factory=list)
+    min_values: List[Any] = field(default_factory=list)
+    max_values: List[Any] = field(default_factory=list)
+    sample_values: List[List[Any]] = field(default_factory=list)
+    
+    def __len__(self) -> int:
+        return len(self.names)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return ColumnInfo.model_construct(
+            name=self.names[index],
+            data_type=self.data_types[index],
+            nullable=self.nullable[index],
+            sample_values=self.sample_values[index],
+            unique_count=self.unique_counts[index],
+            null_count=self.null_counts[index],
+            min_value=self.min_values[index],
+            max_value=self.max_values[index]
+        )
+    
+    def __iter__(self) -> Iterator[ColumnInfo]:
+        return (self[i] for i in range(len(self)))
+
 class DataSourceConfig(BaseModel):
     type: DataSourceType
     name: str
@@ -111,4 +149,6 @@ class SQLGenerationContext(BaseModel):
     database_type: DataSourceType
     schema_name: Optional[str] = None
     table_name: str
-    connection_info: Dict[str, Any] = {}
\ No newline at end of file
+    connection_info: Dict[str, Any] = {}
+    # SQL engine that runs the queries when it is not the source itself (CSV: "duckdb" or "polars")
+    query_engine: Optional[str] = None